@@ -5,20 +5,37 @@ Example Configuration for Deposit Elasticity Parameters
 Этот файл содержит примеры конфигурации параметров эластичности
 для различных типов депозитов и сегментов клиентов.
 """
-from alm_calculator.risks.interest_rate.deposit_elasticity import (
-    ElasticityParameters,
-    CustomerSegment,
-    DepositType
-)
+from dataclasses import replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Mapping, Tuple
+
+from alm_calculator.core.exceptions import ConfigurationError
+
+# Модуль эластичности тянет за собой весь расчетный движок, поэтому
+# импортируется лениво - внутри фабрик, при первом построении конфигурации
+if TYPE_CHECKING:
+    from alm_calculator.risks.interest_rate.deposit_elasticity import (
+        ElasticityParameters,
+        CustomerSegment,
+        DepositType
+    )
+
+ElasticityConfig = Dict[Tuple['CustomerSegment', 'DepositType'], 'ElasticityParameters']
 
 
-def create_conservative_elasticity_config():
+def create_conservative_elasticity_config() -> ElasticityConfig:
     """
     Консервативная конфигурация эластичности.
 
     Используется для стресс-тестирования: предполагает более сильную
     реакцию депозитов на изменение ставок.
     """
+    from alm_calculator.risks.interest_rate.deposit_elasticity import (
+        ElasticityParameters,
+        CustomerSegment,
+        DepositType
+    )
+
     config = {}
 
     # Физические лица - до востребования
@@ -74,30 +91,38 @@ def create_conservative_elasticity_config():
         min_remaining_volume=0.65
     )
 
-    # Юридические лица - все типы
+    # Юридические лица - все типы (параметры отличаются только
+    # deposit_type, поэтому объект строится один раз и копируется)
+    params = ElasticityParameters(
+        customer_segment=CustomerSegment.CORPORATE,
+        deposit_type=DepositType.DEMAND,
+        base_elasticity=-1.0,  # Очень сильная реакция
+        adjustment_speed=0.95,  # Почти мгновенная
+        lag_days=1,
+        competitive_factor=1.8,  # Высокая конкуренция
+        max_volume_change=0.50,
+        min_remaining_volume=0.20
+    )
     for dtype in [DepositType.DEMAND, DepositType.SHORT_TERM,
                   DepositType.MEDIUM_TERM, DepositType.LONG_TERM]:
-        config[(CustomerSegment.CORPORATE, dtype)] = ElasticityParameters(
-            customer_segment=CustomerSegment.CORPORATE,
-            deposit_type=dtype,
-            base_elasticity=-1.0,  # Очень сильная реакция
-            adjustment_speed=0.95,  # Почти мгновенная
-            lag_days=1,
-            competitive_factor=1.8,  # Высокая конкуренция
-            max_volume_change=0.50,
-            min_remaining_volume=0.20
-        )
+        config[(CustomerSegment.CORPORATE, dtype)] = replace(params, deposit_type=dtype)
 
     return config
 
 
-def create_optimistic_elasticity_config():
+def create_optimistic_elasticity_config() -> ElasticityConfig:
     """
     Оптимистичная конфигурация эластичности.
 
     Предполагает более слабую реакцию депозитов на изменение ставок.
     Используется для базовых сценариев.
     """
+    from alm_calculator.risks.interest_rate.deposit_elasticity import (
+        ElasticityParameters,
+        CustomerSegment,
+        DepositType
+    )
+
     config = {}
 
     # Физические лица - до востребования
@@ -132,40 +157,48 @@ def create_optimistic_elasticity_config():
     )
 
     # Физические лица - средне- и долгосрочные
+    params = ElasticityParameters(
+        customer_segment=CustomerSegment.RETAIL,
+        deposit_type=DepositType.MEDIUM_TERM,
+        base_elasticity=-0.2,
+        adjustment_speed=0.4,
+        lag_days=45,
+        max_volume_change=0.10,
+        min_remaining_volume=0.75
+    )
     for dtype in [DepositType.MEDIUM_TERM, DepositType.LONG_TERM]:
-        config[(CustomerSegment.RETAIL, dtype)] = ElasticityParameters(
-            customer_segment=CustomerSegment.RETAIL,
-            deposit_type=dtype,
-            base_elasticity=-0.2,
-            adjustment_speed=0.4,
-            lag_days=45,
-            max_volume_change=0.10,
-            min_remaining_volume=0.75
-        )
+        config[(CustomerSegment.RETAIL, dtype)] = replace(params, deposit_type=dtype)
 
     # Юридические лица
+    params = ElasticityParameters(
+        customer_segment=CustomerSegment.CORPORATE,
+        deposit_type=DepositType.DEMAND,
+        base_elasticity=-0.6,  # Умеренная реакция
+        adjustment_speed=0.7,
+        lag_days=3,
+        competitive_factor=1.2,
+        max_volume_change=0.30,
+        min_remaining_volume=0.40
+    )
     for dtype in [DepositType.DEMAND, DepositType.SHORT_TERM,
                   DepositType.MEDIUM_TERM, DepositType.LONG_TERM]:
-        config[(CustomerSegment.CORPORATE, dtype)] = ElasticityParameters(
-            customer_segment=CustomerSegment.CORPORATE,
-            deposit_type=dtype,
-            base_elasticity=-0.6,  # Умеренная реакция
-            adjustment_speed=0.7,
-            lag_days=3,
-            competitive_factor=1.2,
-            max_volume_change=0.30,
-            min_remaining_volume=0.40
-        )
+        config[(CustomerSegment.CORPORATE, dtype)] = replace(params, deposit_type=dtype)
 
     return config
 
 
-def create_baseline_elasticity_config():
+def create_baseline_elasticity_config() -> ElasticityConfig:
     """
     Базовая конфигурация эластичности.
 
     Сбалансированная конфигурация для обычных расчетов.
     """
+    from alm_calculator.risks.interest_rate.deposit_elasticity import (
+        ElasticityParameters,
+        CustomerSegment,
+        DepositType
+    )
+
     config = {}
 
     # ФЛ - до востребования
@@ -198,30 +231,37 @@ def create_baseline_elasticity_config():
             ElasticityParameters.create_corporate_default(dtype)
 
     # МСБ
+    params = ElasticityParameters(
+        customer_segment=CustomerSegment.SME,
+        deposit_type=DepositType.DEMAND,
+        base_elasticity=-0.6,
+        adjustment_speed=0.8,
+        lag_days=5,
+        competitive_factor=1.3,
+        max_volume_change=0.30,
+        min_remaining_volume=0.40
+    )
     for dtype in [DepositType.DEMAND, DepositType.SHORT_TERM,
                   DepositType.MEDIUM_TERM]:
-        config[(CustomerSegment.SME, dtype)] = ElasticityParameters(
-            customer_segment=CustomerSegment.SME,
-            deposit_type=dtype,
-            base_elasticity=-0.6,
-            adjustment_speed=0.8,
-            lag_days=5,
-            competitive_factor=1.3,
-            max_volume_change=0.30,
-            min_remaining_volume=0.40
-        )
+        config[(CustomerSegment.SME, dtype)] = replace(params, deposit_type=dtype)
 
     return config
 
 
 # Пример кастомной конфигурации для конкретного банка
-def create_custom_bank_elasticity_config():
+def create_custom_bank_elasticity_config() -> ElasticityConfig:
     """
     Кастомная конфигурация для конкретного банка.
 
     Может быть основана на исторических данных, анализе поведения клиентов,
     конкурентной позиции банка и т.д.
     """
+    from alm_calculator.risks.interest_rate.deposit_elasticity import (
+        ElasticityParameters,
+        CustomerSegment,
+        DepositType
+    )
+
     config = {}
 
     # Пример: Банк с очень лояльной базой розничных клиентов
@@ -280,27 +320,46 @@ def create_custom_bank_elasticity_config():
     return config
 
 
-# Словарь всех доступных конфигураций
-ELASTICITY_CONFIGS = {
+# Словарь всех доступных конфигураций: имя -> фабрика.
+# Конфигурация строится при первом запросе и далее берется из кэша.
+ELASTICITY_CONFIGS: Dict[str, Callable[[], ElasticityConfig]] = {
     'baseline': create_baseline_elasticity_config,
     'conservative': create_conservative_elasticity_config,
     'optimistic': create_optimistic_elasticity_config,
     'custom': create_custom_bank_elasticity_config
 }
 
+_BUILT_CONFIGS: Dict[str, Mapping] = {}
+
+_UNKNOWN_CONFIG_MSG = (
+    f"Unknown elasticity config: {{}}. Available: {sorted(ELASTICITY_CONFIGS)}"
+)
+
 
-def get_elasticity_config(config_name: str = 'baseline'):
+def get_elasticity_config(config_name: str = 'baseline') -> Mapping:
     """
     Получает конфигурацию эластичности по имени.
 
+    Конфигурация строится один раз при первом запросе и возвращается
+    как неизменяемое представление (MappingProxyType), поэтому один экземпляр
+    разделяется между всеми вызывающими без копирования. Для изменения
+    используйте dict(get_elasticity_config(name)).
+
     Args:
         config_name: Имя конфигурации ('baseline', 'conservative', 'optimistic', 'custom')
 
     Returns:
-        Dict[Tuple[CustomerSegment, DepositType], ElasticityParameters]
+        Mapping[Tuple[CustomerSegment, DepositType], ElasticityParameters]
+
+    Raises:
+        ConfigurationError: Если конфигурация с таким именем не найдена
     """
     if config_name not in ELASTICITY_CONFIGS:
-        raise ValueError(f"Unknown elasticity config: {config_name}. "
-                        f"Available: {list(ELASTICITY_CONFIGS.keys())}")
+        raise ConfigurationError(_UNKNOWN_CONFIG_MSG.format(config_name))
 
-    return ELASTICITY_CONFIGS[config_name]()
+    config = _BUILT_CONFIGS.get(config_name)
+    if config is None:
+        config = MappingProxyType(ELASTICITY_CONFIGS[config_name]())
+        _BUILT_CONFIGS[config_name] = config
+
+    return config
@@ -1,14 +1,38 @@
 """
 Base classes and interfaces for financial instruments
 """
+import sys
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, asdict
 from typing import Dict, Optional
 from datetime import date
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 from enum import Enum
 
+__all__ = [
+    'InstrumentType',
+    'BookType',
+    'RiskContribution',
+    'BaseInstrument',
+]
 
-class InstrumentType(str, Enum):
+
+class _InternedStrEnum(str, Enum):
+    """
+    Строковый Enum с интернированными значениями.
+
+    Значения (.value) используются как ключи словарей агрегатов и сравниваются
+    со строковыми литералами; sys.intern позволяет срабатывать быстрому пути
+    сравнения по идентичности объекта.
+    """
+
+    def __new__(cls, value: str):
+        member = str.__new__(cls, value)
+        member._value_ = sys.intern(value)
+        return member
+
+
+class InstrumentType(_InternedStrEnum):
     """Типы финансовых инструментов"""
     LOAN = "loan"
     DEPOSIT = "deposit"
@@ -36,7 +60,7 @@ class InstrumentType(str, Enum):
     OTHER = "other"
 
 
-class BookType(str, Enum):
+class BookType(_InternedStrEnum):
     """
     Классификация инструментов по книгам банка.
 
@@ -47,12 +71,16 @@ class BookType(str, Enum):
     BANKING = "banking"
 
 
-class RiskContribution(BaseModel):
+@dataclass(slots=True)
+class RiskContribution:
     """
     Вклад инструмента в риск-метрики
 
     Этот класс собирает все риск-метрики для одного инструмента,
     которые затем агрегируются на портфельном уровне.
+
+    Создается по одному объекту на инструмент в каждом расчете, поэтому
+    это легковесный dataclass со __slots__, а не pydantic-модель.
     """
     instrument_id: str
     instrument_type: InstrumentType
@@ -64,16 +92,39 @@ class RiskContribution(BaseModel):
     modified_duration: Optional[float] = None
     dv01: Optional[float] = None
 
-    # Liquidity Risk
-    cash_flows: Dict[str, float] = Field(default_factory=dict)
-    # Ключ - временная корзина ('0-30d'), значение - сумма CF
-
-    # FX Risk
-    currency_exposure: Dict[str, float] = Field(default_factory=dict)
-    # Ключ - валюта, значение - позиция
+    # Liquidity Risk и FX Risk: словари создаются лениво при первом
+    # обращении через свойства cash_flows / currency_exposure
+    _cash_flows: Optional[Dict[str, float]] = field(default=None, init=False)
+    _currency_exposure: Optional[Dict[str, float]] = field(default=None, init=False)
+
+    @property
+    def cash_flows(self) -> Dict[str, float]:
+        """Денежные потоки: ключ - временная корзина ('0-30d'), значение - сумма CF"""
+        if self._cash_flows is None:
+            self._cash_flows = {}
+        return self._cash_flows
+
+    @cash_flows.setter
+    def cash_flows(self, value: Dict[str, float]) -> None:
+        self._cash_flows = value
+
+    @property
+    def currency_exposure(self) -> Dict[str, float]:
+        """Валютные позиции: ключ - валюта, значение - позиция"""
+        if self._currency_exposure is None:
+            self._currency_exposure = {}
+        return self._currency_exposure
+
+    @currency_exposure.setter
+    def currency_exposure(self, value: Dict[str, float]) -> None:
+        self._currency_exposure = value
 
-    class Config:
-        frozen = False
+    def to_dict(self) -> Dict:
+        """Сериализация в словарь"""
+        data = asdict(self)
+        data['cash_flows'] = data.pop('_cash_flows') or {}
+        data['currency_exposure'] = data.pop('_currency_exposure') or {}
+        return data
 
 
 class BaseInstrument(ABC, BaseModel):
@@ -113,9 +164,13 @@ class BaseInstrument(ABC, BaseModel):
     data_source: str = "balance"
     version: str = "1.0"
     
-    class Config:
-        frozen = False
-        arbitrary_types_allowed = True
+    # Инструменты остаются изменяемыми: apply_assumptions, стресс-сценарии
+    # и модель эластичности обновляют атрибуты на месте (без ревалидации)
+    model_config = ConfigDict(
+        frozen=False,
+        validate_assignment=False,
+        extra='ignore'
+    )
     
     @abstractmethod
     def calculate_risk_contribution(
@@ -181,6 +236,8 @@ class BaseInstrument(ABC, BaseModel):
         Возвращает книгу инструмента (торговую или банковскую).
 
         Если book не установлена явно, определяет автоматически по trading_portfolio.
+        Результат не сохраняется в поле book: проверка префикса дешевая, а
+        сохраненное значение устарело бы при смене trading_portfolio.
 
         Returns:
             BookType: TRADING или BANKING
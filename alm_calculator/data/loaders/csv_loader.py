@@ -4,12 +4,25 @@ CSV Data Loader for ALM Calculator
 Loads balance sheet positions from CSV files and converts them to instrument objects.
 """
 
+import numpy as np
 import pandas as pd
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Union, Optional
-from datetime import datetime, date
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from datetime import date, datetime
 import ast
+import csv
+import json
+import sys
+from functools import lru_cache
+from operator import attrgetter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson опционален: stdlib json медленнее, но совместим
+    _json_loads = json.loads
 
 from alm_calculator.models.instruments.loan import Loan
 from alm_calculator.models.instruments.deposit import Deposit
@@ -23,6 +36,129 @@ from alm_calculator.core.base_instrument import BaseInstrument
 
 logger = logging.getLogger(__name__)
 
+# Маркер пустой ячейки CSV: такие значения не передаются в конструктор инструмента
+_SKIP = object()
+
+# Классификация колонок CSV по целевому типу
+_AMOUNT_COLUMNS = frozenset({
+    'amount', 'notional_amount', 'collateral_value',
+    'pay_leg_amount', 'receive_leg_amount',
+    'utilized_amount', 'available_amount'
+})
+_BOOL_COLUMNS = frozenset({
+    'is_demand_deposit', 'is_placement', 'is_transactional',
+    'is_required_reserve', 'is_monetary', 'is_payer'
+})
+_FLOAT_COLUMNS = frozenset({
+    'interest_rate', 'repo_rate', 'core_portion', 'avg_life_years',
+    'stable_portion', 'volatility_coefficient', 'haircut',
+    'liquidity_haircut', 'draw_down_probability', 'prepayment_rate',
+    'withdrawal_rate_0_30d', 'withdrawal_rate_30_90d', 'withdrawal_rate_90_180d'
+})
+_INT_COLUMNS = frozenset({'avg_life_days'})
+
+# Колонки, значения которых собираются в поле-словарь модели: колонка -> (поле, ключ)
+_DICT_ITEM_COLUMNS = {
+    'withdrawal_rate_0_30d': ('withdrawal_rates', '0-30d'),
+    'withdrawal_rate_30_90d': ('withdrawal_rates', '30-90d'),
+    'withdrawal_rate_90_180d': ('withdrawal_rates', '90-180d'),
+}
+
+# Строковая колонка с долей уникальных значений ниже этого порога (валюта, тип
+# контрагента, балансовый счет) хранит одну интернированную копию каждой строки
+_INTERN_MAX_UNIQUE_RATIO = 0.01
+
+# Файлы меньше этого размера читаются csv.reader без построения DataFrame
+_SMALL_FILE_BYTES = 1024 * 1024
+
+# Значения, которые pd.read_csv по умолчанию считает пропусками
+_NA_VALUES = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+})
+_BOOL_LITERALS = {
+    'True': True, 'TRUE': True, 'true': True,
+    'False': False, 'FALSE': False, 'false': False,
+}
+
+
+def _parse_bool(value: Any) -> bool:
+    """
+    Приводит значение булевой колонки к bool.
+
+    Литералы True/False распознаются по _BOOL_LITERALS, числа - по значению
+    ('0' - False), прочий непустой текст дает True.
+    """
+    if not isinstance(value, str):
+        return bool(value)
+    if value in _BOOL_LITERALS:
+        return _BOOL_LITERALS[value]
+    try:
+        return bool(float(value))
+    except ValueError:
+        return bool(value)
+
+
+@lru_cache(maxsize=None)
+def _classify_column(key: str) -> str:
+    """
+    Определяет целевой тип колонки CSV по ее имени.
+
+    Returns:
+        'date', 'amount', 'bool', 'float', 'int' или 'str'
+    """
+    if key.endswith('_date'):
+        return 'date'
+    if key in _AMOUNT_COLUMNS:
+        return 'amount'
+    if key in _BOOL_COLUMNS:
+        return 'bool'
+    if key in _FLOAT_COLUMNS:
+        return 'float'
+    if key in _INT_COLUMNS:
+        return 'int'
+    return 'str'
+
+
+@lru_cache(maxsize=None)
+def _compile_row_builder(columns: Tuple[str, ...]) -> Callable[[Sequence[Any]], Dict]:
+    """
+    Генерирует функцию сборки словаря аргументов инструмента для заданного
+    набора колонок CSV.
+
+    Функция специализирована под порядок колонок: для каждой позиции
+    сгенерирована отдельная проверка на _SKIP и запись по константному ключу,
+    без zip и обобщенного цикла по парам (колонка, значение). Колонки из
+    _DICT_ITEM_COLUMNS записываются элементами словаря своего поля.
+
+    Args:
+        columns: Имена колонок в порядке следования в строке
+
+    Returns:
+        build_row(row) -> Dict без пустых ячеек
+    """
+    lines = ['def build_row(row):', '    data = {}']
+    for i, key in enumerate(columns):
+        lines.append(f'    value = row[{i}]')
+        lines.append('    if value is not _SKIP:')
+        if key in _DICT_ITEM_COLUMNS:
+            field, item = _DICT_ITEM_COLUMNS[key]
+            lines.append(f'        data.setdefault({field!r}, {{}})[{item!r}] = value')
+        else:
+            lines.append(f'        data[{key!r}] = value')
+    lines.append('    return data')
+
+    namespace = {'_SKIP': _SKIP}
+    exec(compile('\n'.join(lines), '<csv_loader row builder>', 'exec'), namespace)
+    return namespace['build_row']
+
+
+@lru_cache(maxsize=None)
+def _required_columns(instrument_class: type, columns: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Колонки CSV, соответствующие обязательным полям модели инструмента"""
+    fields = instrument_class.model_fields
+    return tuple(key for key in columns if key in fields and fields[key].is_required())
+
 
 class CSVDataLoader:
     """
@@ -31,12 +167,36 @@ class CSVDataLoader:
     Преобразует CSV -> pandas DataFrame -> Instrument objects
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        csv_engine: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        file_format: str = 'csv'
+    ):
         """
         Args:
             data_dir: Директория с CSV файлами
+            csv_engine: Движок pd.read_csv (None - стандартный 'c';
+                        'pyarrow' - многопоточное чтение pyarrow.csv с разбором
+                        по колонкам Arrow, требует пакет pyarrow)
+            max_workers: Число процессов для параллельной загрузки файлов
+                         в load_all_instruments (None или 1 - последовательно)
+            chunksize: Размер блока строк при потоковом чтении CSV
+                       (None - файл читается целиком)
+            file_format: Формат файлов данных: 'csv' или 'parquet'
+                         (<тип>.parquet, как пишет MockDataGenerator с
+                         output_format='parquet'; требует пакет pyarrow)
         """
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported file format: {file_format}")
+
         self.data_dir = Path(data_dir)
+        self.csv_engine = csv_engine
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self.file_format = file_format
 
         if not self.data_dir.exists():
             raise FileNotFoundError(f"Data directory not found: {self.data_dir}")
@@ -64,16 +224,34 @@ class CSVDataLoader:
         """
         logger.info("Loading all instruments from CSV files")
 
-        all_instruments = []
-
+        files = []
         for csv_filename, instrument_class in self.instrument_mapping.items():
-            csv_path = self.data_dir / csv_filename
+            csv_path = self._data_path(csv_filename)
 
             if not csv_path.exists():
                 logger.warning(f"CSV file not found: {csv_path}, skipping...")
                 continue
 
-            instruments = self._load_instrument_file(csv_path, instrument_class)
+            files.append((csv_filename, csv_path, instrument_class))
+
+        if self.max_workers is not None and self.max_workers > 1 and len(files) > 1:
+            # Файлы независимы: загружаем в отдельных процессах (построение
+            # инструментов упирается в GIL), порядок результатов сохраняется
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self._load_instrument_file, csv_path, instrument_class)
+                    for _, csv_path, instrument_class in files
+                ]
+                loaded = [future.result() for future in futures]
+        else:
+            loaded = [
+                self._load_instrument_file(csv_path, instrument_class)
+                for _, csv_path, instrument_class in files
+            ]
+
+        all_instruments = []
+
+        for (csv_filename, _, instrument_class), instruments in zip(files, loaded):
             all_instruments.extend(instruments)
 
             logger.info(
@@ -96,7 +274,7 @@ class CSVDataLoader:
             List of instruments of specified type
         """
         csv_filename = f"{instrument_type}.csv"
-        csv_path = self.data_dir / csv_filename
+        csv_path = self._data_path(csv_filename)
 
         if csv_filename not in self.instrument_mapping:
             raise ValueError(f"Unknown instrument type: {instrument_type}")
@@ -111,6 +289,10 @@ class CSVDataLoader:
 
         return instruments
 
+    def _data_path(self, csv_filename: str) -> Path:
+        """Путь к файлу данных типа инструмента с учетом file_format"""
+        return (self.data_dir / csv_filename).with_suffix(f'.{self.file_format}')
+
     def _load_instrument_file(
         self,
         csv_path: Path,
@@ -126,112 +308,585 @@ class CSVDataLoader:
         Returns:
             List of instrument objects
         """
-        logger.debug(f"Loading {csv_path}")
-
-        # Read CSV
-        df = pd.read_csv(csv_path)
+        logger.debug("Loading %s", csv_path)
+
+        if csv_path.suffix == '.parquet':
+            # Parquet уже типизирован по колонкам: тот же разбор, что и для Arrow CSV
+            return self._load_arrow_file(csv_path, instrument_class)
+
+        if self.csv_engine is None and csv_path.stat().st_size < _SMALL_FILE_BYTES:
+            # Небольшой файл: построение DataFrame дороже самой работы
+            return self._load_small_file(csv_path, instrument_class)
+
+        if self.csv_engine == 'pyarrow' and not self.chunksize:
+            # Таблица Arrow разбирается по колонкам, без построения DataFrame
+            return self._load_arrow_file(csv_path, instrument_class)
+
+        # Read CSV: колонки дат парсятся самим ридером (ISO 8601); если в колонке
+        # встречается нераспознаваемое значение, она остается строковой и
+        # разбирается в _convert_column
+        header = pd.read_csv(csv_path, nrows=0).columns
+        date_columns = [key for key in header if key.endswith('_date')]
+        # Строковые и булевы колонки читаются как текст: иначе ридер выводит тип
+        # по содержимому ('42301' при пропуске в колонке становится 42301.0) и
+        # результат расходится с _load_small_file
+        text_columns = {
+            key: str for key in header if _classify_column(key) in ('str', 'bool')
+        }
+        read_kwargs = dict(
+            parse_dates=date_columns,
+            date_format='ISO8601',
+            dtype=text_columns,
+            engine=self.csv_engine
+        )
+        if self.csv_engine in (None, 'c'):
+            # Точный разбор float (как float() в _load_small_file и парсер pyarrow):
+            # значения не должны зависеть от того, каким путем читался файл
+            read_kwargs['float_precision'] = 'round_trip'
 
         # Convert to instruments
         instruments = []
+        total_rows = 0
+
+        if self.chunksize:
+            # Потоковое чтение: в памяти одновременно только один блок строк.
+            # Типы текстовых колонок заданы в read_kwargs и не выводятся по
+            # содержимому каждого блока отдельно
+            with pd.read_csv(csv_path, chunksize=self.chunksize, **read_kwargs) as reader:
+                for chunk in reader:
+                    instruments.extend(
+                        self._build_instruments(chunk, csv_path, instrument_class, total_rows)
+                    )
+                    total_rows += len(chunk)
+        else:
+            df = pd.read_csv(csv_path, **read_kwargs)
+            instruments = self._build_instruments(df, csv_path, instrument_class)
+            total_rows = len(df)
+
+        self._log_success_rate(len(instruments), total_rows)
 
-        for idx, row in df.iterrows():
-            try:
-                # Convert row to dict and clean up
-                instrument_data = self._prepare_instrument_data(row)
+        return instruments
 
-                # Create instrument object
-                instrument = instrument_class(**instrument_data)
-                instruments.append(instrument)
+    def _load_small_file(
+        self,
+        csv_path: Path,
+        instrument_class: type
+    ) -> List[BaseInstrument]:
+        """
+        Загружает небольшой CSV файл через csv.reader, без DataFrame.
 
-            except Exception as e:
-                logger.error(
-                    f"Failed to create instrument from row {idx} in {csv_path}: {e}",
-                    extra={'row_index': idx, 'error': str(e)}
-                )
-                # Continue processing other rows
-                continue
+        Значения приводятся по тем же правилам, что и в _convert_column:
+        конвертер выбирается один раз на колонку, строки low-cardinality
+        колонок интернируются через _intern_repeated.
 
-        success_rate = len(instruments) / len(df) * 100 if len(df) > 0 else 0
-        logger.debug(
-            f"Successfully created {len(instruments)}/{len(df)} instruments ({success_rate:.1f}%)"
+        Args:
+            csv_path: Путь к CSV файлу
+            instrument_class: Класс инструмента
+
+        Returns:
+            List of instrument objects
+        """
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            columns = tuple(next(reader, ()))
+            width = len(columns)
+            # Короткие строки дополняются пустыми ячейками, как это делает pd.read_csv
+            padding = [''] * width
+            raw_rows = [
+                row if len(row) == width else (row + padding)[:width] for row in reader
+            ]
+
+        raw_columns = list(zip(*raw_rows)) if raw_rows else [()] * width
+        converted = []
+        for key, cells in zip(columns, raw_columns):
+            kind = _classify_column(key)
+            if kind == 'str':
+                cells = self._intern_repeated(key, np.array(cells, dtype=object))
+            convert = self._cell_converter(key, kind, csv_path)
+            converted.append([convert(value) for value in cells])
+        rows = list(zip(*converted)) if converted else [()] * len(raw_rows)
+
+        positions = [
+            columns.index(key) for key in _required_columns(instrument_class, columns)
+        ]
+        incomplete = np.fromiter(
+            (any(row[i] is _SKIP for i in positions) for row in rows),
+            dtype=bool, count=len(rows)
         )
+        instruments = self._create_instruments(
+            instrument_class, columns, rows, incomplete, csv_path
+        )
+
+        self._log_success_rate(len(instruments), len(rows))
 
         return instruments
 
-    def _prepare_instrument_data(self, row: pd.Series) -> Dict:
+    def _load_arrow_file(
+        self,
+        csv_path: Path,
+        instrument_class: type
+    ) -> List[BaseInstrument]:
         """
-        Подготавливает данные из CSV строки для создания инструмента.
+        Загружает CSV (pyarrow.csv) или Parquet (pyarrow.parquet) файл,
+        минуя pandas DataFrame.
 
-        Преобразует типы данных, парсит даты, обрабатывает None/NaN.
+        Колонки, которые Arrow прочитал в целевом типе (даты, числа, булевы
+        значения, строки), переводятся в списки Python напрямую через
+        to_pylist; остальные приводятся через _convert_column.
 
         Args:
-            row: Строка из DataFrame
+            csv_path: Путь к CSV файлу
+            instrument_class: Класс инструмента
 
         Returns:
-            Dict готовый для передачи в конструктор инструмента
+            List of instrument objects
         """
-        data = {}
+        if csv_path.suffix == '.parquet':
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(csv_path)
+        else:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+
+            with open(csv_path, newline='', encoding='utf-8') as f:
+                header = next(csv.reader(f), [])
+            # Пропуски распознаются по тем же маркерам, что и в pd.read_csv;
+            # строковые и булевы колонки читаются как текст, как в pd.read_csv
+            convert_options = pa_csv.ConvertOptions(
+                column_types={
+                    key: pa.string() for key in header
+                    if _classify_column(key) in ('str', 'bool')
+                },
+                null_values=sorted(_NA_VALUES),
+                strings_can_be_null=True
+            )
+            table = pa_csv.read_csv(csv_path, convert_options=convert_options)
+
+        columns = tuple(table.column_names)
+        incomplete = np.zeros(table.num_rows, dtype=bool)
+        for key in _required_columns(instrument_class, columns):
+            incomplete |= table.column(key).is_null().to_numpy(zero_copy_only=False)
+
+        converted = [
+            self._convert_arrow_column(key, table.column(key), csv_path) for key in columns
+        ]
+        rows = list(zip(*converted))
+        instruments = self._create_instruments(
+            instrument_class, columns, rows, incomplete, csv_path
+        )
 
-        for key, value in row.items():
-            # Skip NaN values
-            if pd.isna(value):
-                continue
+        self._log_success_rate(len(instruments), len(rows))
+
+        return instruments
+
+    def _convert_arrow_column(self, key: str, column: Any, csv_path: Path) -> Sequence[Any]:
+        """
+        Приводит колонку pyarrow.ChunkedArray к значениям для конструкторов инструментов.
+
+        Пустые ячейки помечаются _SKIP, как в _convert_column.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        kind = _classify_column(key)
+        arrow_type = column.type
+
+        if pa.types.is_dictionary(arrow_type):
+            # Категориальные колонки Parquet (pd.Categorical) - к значениям словаря
+            column = column.cast(arrow_type.value_type)
+            arrow_type = column.type
 
-            # Convert dates
-            if key.endswith('_date'):
-                if isinstance(value, str):
-                    try:
-                        data[key] = datetime.fromisoformat(value).date()
-                    except Exception:
-                        logger.warning(f"Failed to parse date: {key}={value}")
-                        data[key] = None
-                else:
-                    data[key] = None
-
-            # Convert amounts to float
-            elif key in ['amount', 'notional_amount', 'collateral_value',
-                         'pay_leg_amount', 'receive_leg_amount',
-                         'utilized_amount', 'available_amount']:
+        if kind == 'date' and pa.types.is_string(arrow_type):
+            # Даты в Parquet генератора хранятся ISO-строками; при нестандартных
+            # значениях колонка разбирается в _convert_column
+            try:
+                column = column.cast(pa.date32())
+                arrow_type = column.type
+            except pa.ArrowInvalid:
+                pass
+
+        if kind in ('amount', 'float') and pa.types.is_float32(arrow_type):
+            # float32 переводится через кратчайшую десятичную запись - те же
+            # значения, что при чтении CSV, куда генератор пишет float32 текстом
+            values = column.to_numpy().astype(str).astype(np.float64)
+            column = pa.chunked_array([pa.array(values, from_pandas=True)])
+            arrow_type = column.type
+
+        if kind in ('amount', 'float') and pa.types.is_integer(arrow_type):
+            column = column.cast(pa.float64())
+            arrow_type = column.type
+
+        if kind == 'date':
+            direct = pa.types.is_date32(arrow_type)
+        elif kind in ('amount', 'float'):
+            direct = pa.types.is_float64(arrow_type)
+        elif kind == 'bool':
+            direct = pa.types.is_boolean(arrow_type)
+        elif kind == 'int':
+            direct = pa.types.is_integer(arrow_type)
+        else:
+            # Словари в ячейках (withdrawal_rates и т.п.) разбираются в _convert_column
+            direct = (
+                pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+            ) and not pc.any(
+                pc.starts_with(column, '{')
+            ).as_py()
+
+        if not direct:
+            return self._convert_column(key, column.to_pandas(), csv_path)
+
+        if kind == 'date':
+            # Даты сильно повторяются: в объекты date переводятся только уникальные
+            # значения; код -1 (пропуск) берет последний элемент - _SKIP
+            encoded = column.combine_chunks().dictionary_encode()
+            dates = np.array(encoded.dictionary.to_pylist() + [_SKIP], dtype=object)
+            return dates[encoded.indices.fill_null(-1).to_numpy()]
+
+        values = column.to_pylist()
+        if kind == 'str':
+            values = self._intern_repeated(key, np.array(values, dtype=object)).tolist()
+        if column.null_count:
+            values = [_SKIP if value is None else value for value in values]
+        return values
+
+    def _cell_converter(self, key: str, kind: str, csv_path: Path) -> Callable[[str], Any]:
+        """
+        Возвращает функцию приведения одной текстовой ячейки колонки key.
+
+        Пустые ячейки (и маркеры пропуска pandas: 'NaN', 'None', ...) дают _SKIP.
+        """
+        # Даты сильно повторяются между строками: каждая строка парсится один раз.
+        # Маркеры пропуска заранее лежат в кэше, отдельная проверка не нужна
+        parsed_dates: Dict[str, Any] = dict.fromkeys(_NA_VALUES, _SKIP)
+
+        def convert_date(value: str) -> Any:
+            if value in parsed_dates:
+                return parsed_dates[value]
+            try:
+                parsed = date.fromisoformat(value)
+            except ValueError:
+                # Строки с временем ('2024-12-31T10:00') разбираются через datetime
                 try:
-                    data[key] = float(value)
-                except Exception:
-                    logger.warning(f"Failed to convert to float: {key}={value}")
-                    data[key] = 0.0
+                    parsed = datetime.fromisoformat(value).date()
+                except ValueError:
+                    logger.warning(f"Failed to parse date: {key}={value} ({csv_path.name})")
+                    parsed = None
+            parsed_dates[value] = parsed
+            return parsed
+
+        def convert_amount(value: str) -> Any:
+            try:
+                return float(value)
+            except ValueError:
+                logger.warning(f"Failed to convert to float: {key}={value} ({csv_path.name})")
+                return 0.0
+
+        def convert_float(value: str) -> Any:
+            try:
+                return float(value)
+            except ValueError:
+                return None
 
+        def convert_int(value: str) -> Any:
+            try:
+                return int(float(value))
+            except (ValueError, OverflowError):
+                return None
+
+        if kind == 'date':
+            return convert_date
+
+        if kind == 'amount':
+            # Суммы не бывают словарями: достаточно проверки на пропуск
+            def convert_amount_cell(value: str) -> Any:
+                return _SKIP if value in _NA_VALUES else convert_amount(value)
+
+            return convert_amount_cell
+
+        # Строки передаются как есть: интернирование выполняет вызывающий код
+        # по всей колонке (_intern_repeated)
+        base = {
+            'bool': _parse_bool,
+            'float': convert_float,
+            'int': convert_int,
+            'str': str,
+        }[kind]
+
+        def convert(value: str) -> Any:
+            if value in _NA_VALUES:
+                return _SKIP
             # Parse dict strings (for withdrawal_rates, etc.)
-            elif isinstance(value, str) and value.startswith('{'):
-                try:
-                    data[key] = ast.literal_eval(value)
-                except Exception:
-                    logger.warning(f"Failed to parse dict: {key}={value}")
-                    data[key] = {}
-
-            # Boolean values
-            elif key in ['is_demand_deposit', 'is_placement', 'is_transactional',
-                         'is_required_reserve', 'is_monetary', 'is_payer']:
-                data[key] = bool(value) if not pd.isna(value) else None
-
-            # Float values
-            elif key in ['interest_rate', 'repo_rate', 'core_portion', 'avg_life_years',
-                         'stable_portion', 'volatility_coefficient', 'haircut',
-                         'liquidity_haircut', 'draw_down_probability', 'prepayment_rate']:
-                try:
-                    data[key] = float(value) if not pd.isna(value) else None
-                except Exception:
-                    data[key] = None
+            if value.startswith('{'):
+                return self._parse_dict(key, value.replace("'", '"'), value)
+            return base(value)
 
-            # Integer values
-            elif key in ['avg_life_days']:
-                try:
-                    data[key] = int(value) if not pd.isna(value) else None
-                except Exception:
-                    data[key] = None
+        return convert
+
+    def _build_instruments(
+        self,
+        df: pd.DataFrame,
+        csv_path: Path,
+        instrument_class: type,
+        row_offset: int = 0
+    ) -> List[BaseInstrument]:
+        """
+        Создает инструменты из строк DataFrame (всего файла или одного блока).
+
+        Args:
+            df: Прочитанные строки CSV
+            csv_path: Путь к CSV файлу (для сообщений в логе)
+            instrument_class: Класс инструмента
+            row_offset: Номер первой строки df в файле
+
+        Returns:
+            List of instrument objects
+        """
+        # Приведение типов выполняется по колонкам целиком, до сборки строк
+        columns = tuple(df.columns)
+        required = list(_required_columns(instrument_class, columns))
+        incomplete = df[required].isna().to_numpy().any(axis=1)
+        converted = [self._convert_column(key, df[key], csv_path) for key in columns]
+
+        return self._create_instruments(
+            instrument_class, columns, list(zip(*converted)), incomplete, csv_path, row_offset
+        )
+
+    def _create_instruments(
+        self,
+        instrument_class: type,
+        columns: Tuple[str, ...],
+        rows: List[Sequence[Any]],
+        incomplete: np.ndarray,
+        csv_path: Path,
+        row_offset: int = 0
+    ) -> List[BaseInstrument]:
+        """
+        Создает инструменты из строк с уже приведенными значениями.
+
+        Строки с пустыми обязательными полями отбрасываются заранее по маске
+        incomplete (одна запись в лог на блок). Остальные строки валидируются
+        в цикле без try: исключение перехватывается снаружи цикла, строка
+        логируется и цикл продолжается со следующей.
+
+        Args:
+            instrument_class: Класс инструмента
+            columns: Имена колонок в порядке следования в строке
+            rows: Строки значений (пустые ячейки - _SKIP)
+            incomplete: Маска строк с пустыми обязательными полями
+            csv_path: Путь к CSV файлу (для сообщений в логе)
+            row_offset: Номер первой строки rows в файле
+
+        Returns:
+            List of instrument objects
+        """
+        indices = range(row_offset, row_offset + len(rows))
+        if incomplete.any():
+            if logger.isEnabledFor(logging.ERROR):
+                skipped = (np.flatnonzero(incomplete) + row_offset).tolist()
+                logger.error(
+                    "Skipped %d rows with empty required fields (%s) in %s: rows %s",
+                    len(skipped), ', '.join(_required_columns(instrument_class, columns)),
+                    csv_path, skipped,
+                    extra={'row_indices': skipped, 'count': len(skipped)}
+                )
+            complete = np.flatnonzero(~incomplete)
+            rows = [rows[i] for i in complete]
+            indices = (complete + row_offset).tolist()
+
+        build_row = _compile_row_builder(columns)
+        # model_validate принимает словарь напрямую, без распаковки в keyword-аргументы
+        validate = instrument_class.model_validate
+        instruments = []
+        position = 0
+        while position < len(rows):
+            try:
+                for position in range(position, len(rows)):
+                    instruments.append(validate(build_row(rows[position])))
+                break
+            except Exception as e:
+                # Сообщение и extra строятся, только если уровень ERROR включен
+                if logger.isEnabledFor(logging.ERROR):
+                    idx = indices[position]
+                    logger.error(
+                        "Failed to create instrument from row %d in %s: %s", idx, csv_path, e,
+                        extra={'row_index': idx, 'error': str(e)}
+                    )
+                # Continue processing other rows
+                position += 1
+
+        return instruments
+
+    @staticmethod
+    def _log_success_rate(created: int, total: int) -> None:
+        """Пишет в debug-лог долю строк файла, ставших инструментами"""
+        if logger.isEnabledFor(logging.DEBUG):
+            success_rate = created / total * 100 if total > 0 else 0
+            logger.debug(
+                "Successfully created %d/%d instruments (%.1f%%)", created, total, success_rate
+            )
+
+    def _convert_column(self, key: str, column: pd.Series, csv_path: Path) -> np.ndarray:
+        """
+        Приводит колонку CSV к типам, ожидаемым конструкторами инструментов.
+
+        Преобразует типы данных, парсит даты, обрабатывает None/NaN.
+        Пустые ячейки помечаются _SKIP и не передаются в конструктор.
+
+        Args:
+            key: Имя колонки
+            column: Колонка DataFrame
+            csv_path: Путь к файлу (для сообщений в логе)
 
-            # String values (default)
+        Returns:
+            object-массив значений колонки
+        """
+        kind = _classify_column(key)
+        missing = column.isna().to_numpy()
+        text_mask = self._text_mask(column, missing)
+
+        # Convert dates
+        if kind == 'date':
+            if pd.api.types.is_datetime64_any_dtype(column.dtype):
+                values = column.dt.date.to_numpy(dtype=object, copy=True)
+                return self._mark_missing(values, missing)
+
+            values = np.full(len(column), None, dtype=object)
+            if text_mask.any():
+                parsed = pd.to_datetime(column[text_mask], format='ISO8601', errors='coerce')
+                values[text_mask] = parsed.dt.date.to_numpy(dtype=object)
+                failed = parsed.isna().to_numpy()
+                if failed.any():
+                    logger.warning(
+                        f"Failed to parse {int(failed.sum())} dates in {key} ({csv_path.name})"
+                    )
+                    values[np.flatnonzero(text_mask)[failed]] = None
+            return self._mark_missing(values, missing)
+
+        # Convert amounts to float
+        if kind == 'amount':
+            values, failed = self._to_float(column, missing)
+            if failed.any():
+                logger.warning(
+                    f"Failed to convert {int(failed.sum())} values to float in {key} ({csv_path.name})"
+                )
+                values[failed] = 0.0
+            return self._mark_missing(values, missing)
+
+        # Boolean values: по тем же правилам, что и в _cell_converter;
+        # каждое уникальное значение разбирается один раз
+        if kind == 'bool':
+            codes, uniques = pd.factorize(column)
+            parsed = [_parse_bool(value) for value in uniques.tolist()] + [None]
+            values = np.array(parsed, dtype=object)[codes]
+
+        # Float values
+        elif kind == 'float':
+            values, failed = self._to_float(column, missing)
+            values[failed] = None
+
+        # Integer values
+        elif kind == 'int':
+            numeric = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+            valid = np.isfinite(numeric)
+            values = np.full(len(column), None, dtype=object)
+            values[valid] = np.trunc(numeric[valid]).astype(np.int64).astype(object)
+
+        # String values (default)
+        else:
+            if (text_mask | missing).all():
+                values = column.to_numpy(dtype=object, copy=True)
             else:
-                data[key] = str(value) if not pd.isna(value) else None
+                values = np.array([str(value) for value in column.tolist()], dtype=object)
+            values = self._intern_repeated(key, values)
+
+        # Parse dict strings (for withdrawal_rates, etc.)
+        if text_mask.any():
+            text = column[text_mask]
+            is_dict = text.str.startswith('{').to_numpy(dtype=bool)
+            if is_dict.any():
+                # Одинаковые строки (типовые графики) парсятся один раз;
+                # каждый инструмент получает собственную копию словаря
+                codes, uniques = pd.factorize(text[is_dict])
+                uniques = pd.Series(uniques)
+                # repr-словари пишутся с одинарными кавычками: приводим к JSON целиком по колонке
+                as_json = uniques.str.replace("'", '"', regex=False).tolist()
+                parsed = [
+                    self._parse_dict(key, raw_json, raw)
+                    for raw_json, raw in zip(as_json, uniques.tolist())
+                ]
+                for i, code in zip(np.flatnonzero(text_mask)[is_dict], codes):
+                    values[i] = dict(parsed[code])
+
+        return self._mark_missing(values, missing)
+
+    @staticmethod
+    def _parse_dict(key: str, raw_json: str, raw: str) -> Dict:
+        """
+        Парсит словарь из ячейки CSV.
 
-        return data
+        Быстрый путь - JSON-парсер; значения, не являющиеся валидным JSON
+        (например, с ключами-числами или True/None), разбираются ast.literal_eval.
+        """
+        try:
+            return _json_loads(raw_json)
+        except ValueError:
+            pass
+        try:
+            return ast.literal_eval(raw)
+        except Exception:
+            logger.warning(f"Failed to parse dict: {key}={raw}")
+            return {}
+
+    @staticmethod
+    def _intern_repeated(key: str, values: np.ndarray) -> np.ndarray:
+        """
+        Заменяет строки low-cardinality колонки интернированными копиями.
+
+        Каждая ячейка, прочитанная из CSV, - отдельный объект str; для колонок
+        вроде currency все инструменты получают ссылки на один объект.
+        Колонки идентификаторов (*_id) не проверяются: значения в них
+        практически уникальны.
+        """
+        if key.endswith('_id'):
+            return values
+        codes, uniques = pd.factorize(values)
+        if len(uniques) >= _INTERN_MAX_UNIQUE_RATIO * len(values):
+            return values
+        # Код -1 (пропуск) берет последний элемент; такие ячейки затем помечаются _SKIP
+        interned = np.array([sys.intern(value) for value in uniques] + [None], dtype=object)
+        return interned[codes]
+
+    @staticmethod
+    def _text_mask(column: pd.Series, missing: np.ndarray) -> np.ndarray:
+        """Маска ячеек колонки, содержащих строки"""
+        inferred = pd.api.types.infer_dtype(column, skipna=True)
+        if inferred == 'string':
+            return ~missing
+        if inferred.startswith('mixed'):
+            return np.fromiter(
+                (isinstance(value, str) for value in column.tolist()),
+                dtype=bool, count=len(column)
+            )
+        return np.zeros(len(column), dtype=bool)
+
+    @staticmethod
+    def _mark_missing(values: np.ndarray, missing: np.ndarray) -> np.ndarray:
+        """Помечает пустые ячейки маркером _SKIP"""
+        values[missing] = _SKIP
+        return values
+
+    @staticmethod
+    def _to_float(column: pd.Series, missing: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Векторно приводит колонку к float; возвращает (значения, маска ошибок)"""
+        if pd.api.types.is_float_dtype(column.dtype) or pd.api.types.is_integer_dtype(column.dtype):
+            # Числовая колонка уже типизирована ридером: берем NumPy-буфер без разбора
+            numeric = column.to_numpy(dtype=np.float64, copy=False)
+            return numeric.astype(object), np.zeros(len(column), dtype=bool)
+
+        numeric = pd.to_numeric(column, errors='coerce')
+        failed = numeric.isna().to_numpy() & ~missing
+        return numeric.to_numpy(dtype=float).astype(object), failed
 
     def get_portfolio_summary(self, instruments: List[BaseInstrument]) -> pd.DataFrame:
         """
@@ -246,29 +901,33 @@ class CSVDataLoader:
         if not instruments:
             return pd.DataFrame()
 
-        # Group by instrument type
-        summary_data = []
-
-        instruments_by_type = {}
-        for instrument in instruments:
-            inst_type = instrument.instrument_type.value
-            if inst_type not in instruments_by_type:
-                instruments_by_type[inst_type] = []
-            instruments_by_type[inst_type].append(instrument)
-
-        for inst_type, inst_list in instruments_by_type.items():
-            amounts = [float(inst.amount) for inst in inst_list]
-
-            summary_data.append({
-                'instrument_type': inst_type,
-                'count': len(inst_list),
-                'total_amount': sum(amounts),
-                'avg_amount': sum(amounts) / len(amounts) if amounts else 0,
-                'min_amount': min(amounts) if amounts else 0,
-                'max_amount': max(amounts) if amounts else 0,
+        # Колонки собираются np.fromiter с известной длиной, без промежуточных списков;
+        # группировка идет по самим членам InstrumentType, .value берется по группам
+        count = len(instruments)
+        portfolio = pd.DataFrame({
+            'instrument_type': np.fromiter(
+                map(attrgetter('instrument_type'), instruments), dtype=object, count=count
+            ),
+            'amount': np.fromiter(
+                map(attrgetter('amount'), instruments), dtype=np.float64, count=count
+            ),
+        })
+
+        # Group by instrument type (порядок групп - порядок первого появления)
+        summary_df = (
+            portfolio.groupby('instrument_type', sort=False)['amount']
+            .agg(['count', 'sum', 'mean', 'min', 'max'])
+            .rename(columns={
+                'sum': 'total_amount',
+                'mean': 'avg_amount',
+                'min': 'min_amount',
+                'max': 'max_amount',
             })
-
-        summary_df = pd.DataFrame(summary_data)
+            .reset_index()
+        )
+        summary_df['instrument_type'] = (
+            summary_df['instrument_type'].map(attrgetter('value')).astype(str)
+        )
         summary_df = summary_df.sort_values('total_amount', ascending=False)
 
         return summary_df
@@ -17,131 +17,419 @@ Distribution:
 
 import pandas as pd
 import numpy as np
-from datetime import date, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from statistics import NormalDist
 
-from typing import List, Dict
-import random
+from typing import Any, Iterator, List, Dict, Optional, Sequence, Tuple, Union
+import math
 import logging
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Низкокардинальные строковые колонки, которые генераторы хранят как pd.Categorical
+CATEGORICAL_COLUMNS = frozenset({
+    'currency', 'counterparty_type', 'trading_portfolio', 'balance_account',
+    'collateral_type', 'credit_rating', 'account_type', 'asset_category',
+    'liability_category', 'priority_level', 'off_balance_type', 'derivative_type',
+    'pay_leg_currency', 'receive_leg_currency'
+})
+
+# Ставки и доли хранятся во float32 (7 значащих цифр достаточно, вдвое меньше
+# памяти); суммы остаются float64 - крупные позиции требуют точности до копеек
+FLOAT32_COLUMNS = frozenset({
+    'interest_rate', 'repo_rate', 'haircut', 'liquidity_haircut',
+    'core_portion', 'avg_life_years', 'stable_portion', 'draw_down_probability',
+    'withdrawal_rate_0_30d', 'withdrawal_rate_30_90d', 'withdrawal_rate_90_180d'
+})
+
+# Поэлементные функции стандартного нормального распределения (stdlib, без scipy)
+_NORMAL_PPF = np.frompyfunc(NormalDist().inv_cdf, 1, 1)
+_ERFC = np.frompyfunc(math.erfc, 1, 1)
+# Границы вероятности для квантили: inv_cdf определена только на (0, 1)
+_PROB_MIN = np.nextafter(0.0, 1.0)
+_PROB_MAX = np.nextafter(1.0, 0.0)
+
+
+def _normal_cdf(z: np.ndarray) -> np.ndarray:
+    """Функция распределения N(0, 1)"""
+    # Аргументы - границы диапазонов, выбранные из небольших таблиц параметров:
+    # функция считается один раз на уникальное значение
+    z = np.asarray(z, dtype=np.float64)
+    values, inverse = np.unique(z, return_inverse=True)
+    cdf = 0.5 * np.asarray(_ERFC(-values / math.sqrt(2)), dtype=np.float64)
+    return cdf[inverse].reshape(z.shape)
+
+
+def _normal_ppf(prob: np.ndarray) -> np.ndarray:
+    """Квантиль N(0, 1)"""
+    prob = np.clip(prob, _PROB_MIN, _PROB_MAX)
+    return np.asarray(_NORMAL_PPF(prob), dtype=np.float64)
+
+
+# Наборы данных генератора (у каждого - свой поток случайных чисел)
+DATASETS = (
+    'loans', 'deposits', 'interbank', 'repo', 'reverse_repo', 'current_accounts',
+    'correspondent_accounts', 'other_assets', 'other_liabilities', 'off_balance'
+)
+
+# Базовые ставки, % годовых: строка - режим ставок (0 - до 2024 года,
+# 1 - с 2024 года, после повышения ключевой ставки), колонка - код валюты
+# в порядке RUB, USD, EUR, CNY
+LOAN_BASE_RATES = np.array([[7.5, 5.5, 4.0, 3.5], [16.0, 5.5, 4.0, 3.5]])
+DEPOSIT_BASE_RATES = np.array([[6.5, 4.5, 3.0, 2.5], [15.0, 4.5, 3.0, 2.5]])
+INTERBANK_BASE_RATES = np.array([[7.0, 5.5, 4.0], [16.0, 5.5, 4.0]])
+REPO_BASE_RATES = np.array([[7.0, 5.5], [16.0, 5.5]])
+
+# Делитель для пересчета суммы в валюту инструмента (упрощенно - один курс
+# для всех иностранных валют), по коду валюты в порядке RUB, USD, EUR, CNY
+FX_DIVISORS = np.array([1.0, 85.0, 85.0, 85.0])
+
+# Форматы файлов, в которые сохраняются наборы данных
+OUTPUT_FORMATS = ('csv', 'parquet')
+
+# Строк в блоке записи (группа строк Parquet / блок to_csv)
+WRITE_CHUNK_SIZE = 50_000
+
+# Справочники (общие для всех генераторов; категории колонок pd.Categorical)
+CURRENCIES = ('RUB', 'USD', 'EUR', 'CNY')
+CURRENCY_WEIGHTS = (0.70, 0.15, 0.10, 0.05)  # RUB dominates
+
+COUNTERPARTY_TYPES = ('retail', 'corporate', 'bank', 'government', 'central_bank')
+
+# Торговые портфели (для определения книги)
+# Портфели с префиксом "TRADING_" относятся к торговой книге
+# Остальные - к банковской книге
+TRADING_PORTFOLIOS = (
+    'TRADING_BONDS',
+    'TRADING_DERIVATIVES',
+    'TRADING_FX',
+    'TRADING_REPO',
+    'BANKING_LOANS',
+    'BANKING_DEPOSITS',
+    'BANKING_INTERBANK',
+    'BANKING_RETAIL'
+)
+
+# Балансовые счета (упрощенная классификация)
+BALANCE_ACCOUNTS = {
+    'loan': ('40101', '40102', '40103', '45201', '45202'),
+    'deposit': ('42301', '42302', '42601', '42602', '47401'),
+    'interbank_loan': ('32001', '32002', '32101', '32102'),
+    'repo': ('50601', '50602'),
+    'reverse_repo': ('50401', '50402'),
+    'current_account': ('40702', '40703', '40802', '40817'),
+    'correspondent': ('30102', '30109', '30110', '30114'),
+    'other_asset': ('60101', '60201', '60301'),
+    'other_liability': ('60302', '60303', '60401'),
+}
+
+# Вероятность попадания инструмента в торговую книгу по типу инструмента
+TRADING_PROBABILITY = {
+    'loan': 0.05,  # Большинство кредитов - в банковской книге
+    'deposit': 0.02,  # Депозиты обычно в банковской книге
+    'interbank': 0.20,  # МБК могут быть в торговой книге если короткие
+    'repo': 0.40,  # РЕПО часто для торговых целей
+    'reverse_repo': 0.30,
+    'bond': 0.50,  # Облигации могут быть в обеих книгах
+    'derivative': 0.80,  # Деривативы чаще в торговой книге
+    'current_account': 0.0,  # Текущие счета только в банковской
+    'correspondent': 0.0,  # Корсчета только в банковской
+    'other': 0.10
+}
+
 
 class MockDataGenerator:
     """
     Генератор mock данных для тестирования ALM системы.
     """
 
-    def __init__(self, as_of_date: date, output_dir: Path, random_seed: int = 42):
+    def __init__(
+        self,
+        as_of_date: date,
+        output_dir: Path,
+        random_seed: int = 42,
+        max_workers: Optional[int] = None,
+        output_format: str = 'csv'
+    ):
         """
         Args:
             as_of_date: Дата, на которую генерируем балансовые данные
-            output_dir: Директория для сохранения CSV файлов
+            output_dir: Директория для сохранения файлов с данными
             random_seed: Seed для воспроизводимости
+            max_workers: Число процессов для параллельной генерации наборов данных
+                         в generate_all_instruments (None или 1 - последовательно)
+            output_format: Формат файлов в save_datasets: 'csv' (читает CSVDataLoader)
+                           или 'parquet' (требует пакет pyarrow)
         """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unsupported output format: {output_format} (expected one of {OUTPUT_FORMATS})"
+            )
+
         self.as_of_date = as_of_date
         self.output_dir = Path(output_dir)
+        self.max_workers = max_workers
+        self.output_format = output_format
+        # Строка таблиц базовых ставок для даты баланса
+        self._rate_regime = int(as_of_date.year >= 2024)
+        # Значение колонки as_of_date (одно на все наборы данных)
+        self._as_of_iso = as_of_date.isoformat()
+        # Дата баланса как datetime64[D]: база векторной арифметики дат в _iso_dates
+        self._as_of_day = np.datetime64(as_of_date, 'D')
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set random seed for reproducibility
-        random.seed(random_seed)
-        np.random.seed(random_seed)
-
-        # Справочники
-        self.currencies = ['RUB', 'USD', 'EUR', 'CNY']
-        self.currency_weights = [0.70, 0.15, 0.10, 0.05]  # RUB dominates
-
-        self.counterparty_types = ['retail', 'corporate', 'bank', 'government', 'central_bank']
-
-        # Торговые портфели (для определения книги)
-        # Портфели с префиксом "TRADING_" относятся к торговой книге
-        # Остальные - к банковской книге
-        self.trading_portfolios = [
-            'TRADING_BONDS',
-            'TRADING_DERIVATIVES',
-            'TRADING_FX',
-            'TRADING_REPO',
-            'BANKING_LOANS',
-            'BANKING_DEPOSITS',
-            'BANKING_INTERBANK',
-            'BANKING_RETAIL'
-        ]
-
-        # Балансовые счета (упрощенная классификация)
-        self.balance_accounts = {
-            'loan': ['40101', '40102', '40103', '45201', '45202'],
-            'deposit': ['42301', '42302', '42601', '42602', '47401'],
-            'interbank_loan': ['32001', '32002', '32101', '32102'],
-            'repo': ['50601', '50602'],
-            'reverse_repo': ['50401', '50402'],
-            'current_account': ['40702', '40703', '40802', '40817'],
-            'correspondent': ['30102', '30109', '30110', '30114'],
-            'other_asset': ['60101', '60201', '60301'],
-            'other_liability': ['60302', '60303', '60401'],
+        # Независимые потоки PCG64 по наборам данных из одного seed: результат
+        # набора не зависит от порядка (и параллельности) генерации остальных
+        seed_sequence = np.random.SeedSequence(random_seed)
+        self._rngs = {
+            dataset: np.random.default_rng(child)
+            for dataset, child in zip(DATASETS, seed_sequence.spawn(len(DATASETS)))
         }
 
-    def _assign_trading_portfolio(
+    def _assign_trading_portfolios(
         self,
+        rng: np.random.Generator,
         instrument_type: str,
-        counterparty_type: str = None,
-        is_short_term: bool = False
-    ) -> str:
+        count: int,
+        is_retail: Union[bool, np.ndarray] = False,
+        is_short_term: Union[bool, np.ndarray] = False
+    ) -> pd.Categorical:
         """
-        Определяет торговый портфель инструмента на основе его характеристик.
+        Определяет торговые портфели инструментов одного типа на основе их характеристик.
 
         Args:
-            instrument_type: Тип инструмента
-            counterparty_type: Тип контрагента
-            is_short_term: Является ли инструмент краткосрочным
+            rng: Генератор случайных чисел набора данных
+            instrument_type: Тип инструментов
+            count: Количество инструментов
+            is_retail: Признак розничного контрагента (массив длины count или одно значение)
+            is_short_term: Признак краткосрочности (массив длины count или одно значение)
 
         Returns:
-            Название торгового портфеля
+            Колонка pd.Categorical с названиями торговых портфелей
         """
-        # Вероятность попадания в торговую книгу зависит от типа инструмента
-        trading_probability = {
-            'loan': 0.05,  # Большинство кредитов - в банковской книге
-            'deposit': 0.02,  # Депозиты обычно в банковской книге
-            'interbank': 0.20,  # МБК могут быть в торговой книге если короткие
-            'repo': 0.40,  # РЕПО часто для торговых целей
-            'reverse_repo': 0.30,
-            'bond': 0.50,  # Облигации могут быть в обеих книгах
-            'derivative': 0.80,  # Деривативы чаще в торговой книге
-            'current_account': 0.0,  # Текущие счета только в банковской
-            'correspondent': 0.0,  # Корсчета только в банковской
-            'other': 0.10
-        }
+        # Вероятность попадания в торговую книгу зависит от типа инструмента;
+        # короткие инструменты чаще в торговой книге
+        prob = TRADING_PROBABILITY.get(instrument_type, 0.10)
+        prob = np.where(is_short_term, prob * 1.5, prob)
 
-        prob = trading_probability.get(instrument_type, 0.10)
+        # Определяем книгу
+        is_trading = rng.random(count) < prob
+
+        # Торговая книга
+        if instrument_type in ['repo', 'reverse_repo']:
+            trading = 'TRADING_REPO'
+        elif instrument_type in ['derivative', 'off_balance']:
+            trading = 'TRADING_DERIVATIVES'
+        elif instrument_type == 'bond':
+            trading = 'TRADING_BONDS'
+        else:
+            trading = 'TRADING_FX'
+
+        # Банковская книга (розничные клиенты прочих инструментов - в розничном портфеле)
+        is_retail_banking = False
+        if instrument_type in ['loan']:
+            banking = 'BANKING_LOANS'
+        elif instrument_type in ['deposit']:
+            banking = 'BANKING_DEPOSITS'
+        elif instrument_type in ['interbank', 'repo', 'reverse_repo']:
+            banking = 'BANKING_INTERBANK'
+        else:
+            banking = 'BANKING_DEPOSITS'
+            is_retail_banking = is_retail
 
-        # Короткие инструменты чаще в торговой книге
-        if is_short_term:
-            prob *= 1.5
+        # Коды портфелей: 0 - торговый, 1 - банковский, 2 - розничный банковский
+        codes = np.where(is_trading, 0, np.where(is_retail_banking, 2, 1))
+        return pd.Categorical.from_codes(
+            codes, categories=[trading, banking, 'BANKING_RETAIL']
+        ).remove_unused_categories()
 
-        # Определяем книгу
-        is_trading = np.random.rand() < prob
-
-        if is_trading:
-            # Торговая книга
-            if instrument_type in ['repo', 'reverse_repo']:
-                return 'TRADING_REPO'
-            elif instrument_type in ['derivative', 'off_balance']:
-                return 'TRADING_DERIVATIVES'
-            elif instrument_type == 'bond':
-                return 'TRADING_BONDS'
-            else:
-                return 'TRADING_FX'
+    @staticmethod
+    def _to_frame(columns: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Собирает DataFrame из колонок (массивов или скаляров).
+
+        Низкокардинальные строковые колонки (валюта, тип контрагента,
+        портфель, ...) хранятся как pd.Categorical: коды вместо объекта str на строку.
+        Строковые скаляры (тип инструмента, as_of_date, источник, версия) -
+        pd.Categorical с одной категорией. Ставки и доли (FLOAT32_COLUMNS)
+        приводятся к float32.
+        """
+        size = len(columns['instrument_id'])
+        for key, value in columns.items():
+            if isinstance(value, str):
+                columns[key] = pd.Categorical.from_codes(
+                    np.zeros(size, dtype=np.int8), categories=[value]
+                )
+        for key in CATEGORICAL_COLUMNS.intersection(columns):
+            if isinstance(columns[key], (np.ndarray, list)):
+                columns[key] = pd.Categorical(columns[key])
+        for key in FLOAT32_COLUMNS.intersection(columns):
+            if isinstance(columns[key], np.ndarray):
+                columns[key] = columns[key].astype(np.float32)
+        # Массивы колонок созданы генератором и больше нигде не используются:
+        # DataFrame берет их без копирования
+        return pd.DataFrame(columns, copy=False)
+
+    @staticmethod
+    def _categorical(
+        categories: Sequence[str],
+        codes: np.ndarray
+    ) -> pd.Categorical:
+        """Колонка pd.Categorical из кодов категорий (без строки на каждую запись)"""
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    @classmethod
+    def _choice_categorical(
+        cls,
+        rng: np.random.Generator,
+        categories: Sequence[str],
+        size: int,
+        p: Optional[Sequence[float]] = None
+    ) -> pd.Categorical:
+        """
+        Случайная выборка категорий в виде pd.Categorical.
+
+        Разыгрываются целочисленные коды категорий (rng.integers, при заданных
+        вероятностях - _sample_codes), массив строк по записям не создается.
+
+        Args:
+            rng: Генератор случайных чисел набора данных
+            categories: Категории
+            size: Количество значений
+            p: Вероятности категорий (None - равновероятно)
+
+        Returns:
+            Колонка pd.Categorical длины size
+        """
+        if p is None:
+            codes = rng.integers(0, len(categories), size=size)
         else:
-            # Банковская книга
-            if instrument_type in ['loan']:
-                return 'BANKING_LOANS'
-            elif instrument_type in ['deposit']:
-                return 'BANKING_DEPOSITS'
-            elif instrument_type in ['interbank', 'repo', 'reverse_repo']:
-                return 'BANKING_INTERBANK'
-            elif counterparty_type == 'retail':
-                return 'BANKING_RETAIL'
-            else:
-                return 'BANKING_DEPOSITS'
+            codes = cls._sample_codes(rng, p, size)
+        return cls._categorical(categories, codes)
+
+    @staticmethod
+    def _sample_codes(
+        rng: np.random.Generator,
+        p: Union[Sequence[float], np.ndarray],
+        size: int,
+        rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Коды значений дискретного распределения методом обратной функции распределения.
+
+        Равномерная величина переводится в код поиском по накопленным
+        вероятностям (np.searchsorted) - без общих проверок rng.choice.
+
+        Args:
+            rng: Генератор случайных чисел набора данных
+            p: Вероятности значений; двумерная таблица - распределение на каждую строку
+            size: Количество значений
+            rows: Номер распределения (строки таблицы p) для каждого значения
+
+        Returns:
+            int64-массив кодов значений
+        """
+        cdf = np.cumsum(p, axis=-1)
+        cdf /= cdf[..., -1:]
+        uniform = rng.random(size)
+        if rows is None:
+            return np.searchsorted(cdf, uniform, side='right')
+        # Код - число значений, накопленная вероятность которых не превышает uniform
+        return (cdf[rows] <= uniform[:, np.newaxis]).sum(axis=1)
+
+    @staticmethod
+    def _make_ids(
+        prefix: Union[str, np.ndarray],
+        numbers: np.ndarray,
+        width: int
+    ) -> np.ndarray:
+        """
+        Идентификаторы вида <префикс><номер с ведущими нулями> для колонки.
+
+        Строки собираются векторно (np.char) по одному разу на уникальную
+        пару (префикс, номер) и раздаются по индексу.
+
+        Args:
+            prefix: Префикс (один на колонку или массив по строкам)
+            numbers: Номера по строкам
+            width: Минимальная ширина номера
+
+        Returns:
+            object-массив идентификаторов
+        """
+        if np.size(numbers) == 0:
+            return np.empty(0, dtype=object)
+
+        prefix_codes, prefixes = pd.factorize(np.broadcast_to(prefix, np.shape(numbers)))
+        keys = prefix_codes * (int(np.max(numbers, initial=0)) + 1) + numbers
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        ids = np.char.add(
+            np.asarray(prefixes, dtype=str)[prefix_codes[first]],
+            np.char.zfill(np.asarray(numbers)[first].astype(str), width)
+        )
+        return ids.astype(object)[inverse]
+
+    @staticmethod
+    def _truncated_lognormal(
+        rng: np.random.Generator,
+        mean: Union[float, np.ndarray],
+        sigma: Union[float, np.ndarray],
+        low: Union[float, np.ndarray],
+        high: Union[float, np.ndarray],
+        size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Лог-нормальные суммы, усеченные на [low, high], методом обратной функции распределения.
+
+        В отличие от lognormal + clip суммы не скапливаются на границах:
+        равномерная величина переводится в отрезок [F(low), F(high)] функции
+        распределения, затем - обратно квантилью нормального распределения.
+
+        Args:
+            rng: Генератор случайных чисел набора данных
+            mean: Среднее логарифма суммы (как у Generator.lognormal)
+            sigma: Стандартное отклонение логарифма суммы
+            low: Минимальная сумма
+            high: Максимальная сумма
+            size: Количество сумм, если все параметры - скаляры
+
+        Returns:
+            Массив сумм (форма - общая форма параметров или size)
+        """
+        shape = np.broadcast_shapes(
+            np.shape(mean), np.shape(sigma), np.shape(low), np.shape(high),
+            () if size is None else (size,)
+        )
+        cdf_low = _normal_cdf((np.log(low) - mean) / sigma)
+        cdf_high = _normal_cdf((np.log(high) - mean) / sigma)
+        prob = cdf_low + rng.random(shape) * (cdf_high - cdf_low)
+        return np.exp(mean + sigma * _normal_ppf(prob))
+
+    def _iso_dates(
+        self,
+        offsets: np.ndarray,
+        valid: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Даты as_of_date + offsets в формате ISO для колонок CSV.
+
+        Args:
+            offsets: Смещения от as_of_date в днях
+            valid: Маска строк, у которых дата есть (для остальных - None)
+
+        Returns:
+            object-массив строк 'YYYY-MM-DD' (None вне маски valid)
+        """
+        # Смещения сильно повторяются: строки форматируются один раз на
+        # уникальное смещение (np.datetime_as_string) и раздаются по индексу
+        unique_offsets, inverse = np.unique(np.asarray(offsets), return_inverse=True)
+        unique_dates = self._as_of_day + unique_offsets.astype('timedelta64[D]')
+        dates = np.datetime_as_string(unique_dates, unit='D').astype(object)[inverse]
+        if valid is not None:
+            dates[~valid] = None
+        return dates
 
     def generate_all_instruments(
         self,
@@ -155,8 +443,68 @@ class MockDataGenerator:
         """
         logger.info(f"Starting mock data generation for {total_positions} total positions")
 
-        # Распределение по типам инструментов
-        distributions = {
+        distributions = self._dataset_sizes(total_positions)
+
+        if self.max_workers is not None and self.max_workers > 1:
+            # Наборы данных независимы (у каждого свой поток случайных чисел):
+            # генерируем в отдельных процессах, результат совпадает с последовательным
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self._generate_dataset, dataset, distributions[dataset])
+                    for dataset in DATASETS
+                ]
+                generated = [future.result() for future in futures]
+        else:
+            generated = [
+                self._generate_dataset(dataset, distributions[dataset])
+                for dataset in DATASETS
+            ]
+
+        datasets = {}
+        for dataset, (data, rng) in zip(DATASETS, generated):
+            datasets[dataset] = data
+            # Состояние потока из процесса-исполнителя: повторный вызов
+            # продолжает поток так же, как при последовательной генерации
+            self._rngs[dataset] = rng
+
+        logger.info("Mock data generation completed")
+
+        return datasets
+
+    def iter_chunks(
+        self,
+        total_positions: int = 200_000,
+        chunk_size: int = WRITE_CHUNK_SIZE
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Генерирует инструменты потоком блоков строк для последовательной записи.
+
+        Наборы данных генерируются по одному: в памяти одновременно находится
+        только текущий набор, а не все сразу, как в generate_all_instruments.
+        Значения совпадают с последовательной generate_all_instruments.
+
+        Args:
+            total_positions: Общее количество позиций
+            chunk_size: Максимальное число строк в блоке
+
+        Yields:
+            (название набора данных, DataFrame блока строк)
+        """
+        logger.info(f"Starting chunked mock data generation for {total_positions} total positions")
+
+        for dataset, count in self._dataset_sizes(total_positions).items():
+            data, _ = self._generate_dataset(dataset, count)
+            for start in range(0, len(data), chunk_size):
+                yield dataset, data.iloc[start:start + chunk_size]
+            # Набор освобождается до генерации следующего
+            del data
+
+        logger.info("Mock data generation completed")
+
+    @staticmethod
+    def _dataset_sizes(total_positions: int) -> Dict[str, int]:
+        """Распределение позиций по наборам данных (в порядке DATASETS)"""
+        return {
             'loans': int(total_positions * 0.40),
             'deposits': int(total_positions * 0.35),
             'interbank': int(total_positions * 0.10),
@@ -169,829 +517,775 @@ class MockDataGenerator:
             'off_balance': int(total_positions * 0.01),
         }
 
-        datasets = {}
-
-        # Generate each instrument type
-        datasets['loans'] = self._generate_loans(distributions['loans'])
-        datasets['deposits'] = self._generate_deposits(distributions['deposits'])
-        datasets['interbank'] = self._generate_interbank(distributions['interbank'])
-        datasets['repo'] = self._generate_repo(distributions['repo'])
-        datasets['reverse_repo'] = self._generate_reverse_repo(distributions['reverse_repo'])
-        datasets['current_accounts'] = self._generate_current_accounts(distributions['current_accounts'])
-        datasets['correspondent_accounts'] = self._generate_correspondent_accounts(distributions['correspondent_accounts'])
-        datasets['other_assets'] = self._generate_other_assets(distributions['other_assets'])
-        datasets['other_liabilities'] = self._generate_other_liabilities(distributions['other_liabilities'])
-        datasets['off_balance'] = self._generate_off_balance(distributions['off_balance'])
+    def _generate_dataset(
+        self,
+        dataset: str,
+        count: int
+    ) -> Tuple[pd.DataFrame, np.random.Generator]:
+        """
+        Генерирует один набор данных.
 
-        logger.info("Mock data generation completed")
+        Args:
+            dataset: Название набора данных (из DATASETS)
+            count: Количество инструментов
 
-        return datasets
+        Returns:
+            DataFrame набора и его генератор случайных чисел после генерации
+        """
+        generate = getattr(self, f'_generate_{dataset}')
+        return generate(count), self._rngs[dataset]
 
     def _generate_loans(self, count: int) -> pd.DataFrame:
         """Генерирует кредиты"""
         logger.info(f"Generating {count} loans")
-
-        loans = []
-        for i in range(count):
-            # Тип заемщика
-            cpty_type = np.random.choice(
-                ['retail', 'corporate', 'government'],
-                p=[0.60, 0.35, 0.05]
-            )
-
-            # Сумма кредита зависит от типа заемщика
-            if cpty_type == 'retail':
-                amount = np.random.lognormal(mean=13.0, sigma=1.5)  # ~450k RUB average
-                min_amount, max_amount = 50_000, 50_000_000
-            elif cpty_type == 'corporate':
-                amount = np.random.lognormal(mean=16.0, sigma=2.0)  # ~9M RUB average
-                min_amount, max_amount = 500_000, 5_000_000_000
-            else:  # government
-                amount = np.random.lognormal(mean=18.0, sigma=1.5)  # ~65M RUB average
-                min_amount, max_amount = 10_000_000, 10_000_000_000
-
-            amount = np.clip(amount, min_amount, max_amount)
-
-            # Валюта
-            currency = np.random.choice(self.currencies, p=self.currency_weights)
-            if currency != 'RUB':
-                amount = amount / 85  # Convert to USD-equivalent
-
-            # Срок кредита
-            if cpty_type == 'retail':
-                # Розница: ипотека (долго) или потреб (средне)
-                is_mortgage = np.random.rand() < 0.3
-                if is_mortgage:
-                    maturity_days = int(np.random.uniform(3650, 10950))  # 10-30 лет
-                else:
-                    maturity_days = int(np.random.uniform(180, 1825))  # 6 мес - 5 лет
-            elif cpty_type == 'corporate':
-                maturity_days = int(np.random.uniform(365, 3650))  # 1-10 лет
-            else:  # government
-                maturity_days = int(np.random.uniform(1825, 7300))  # 5-20 лет
-
-            start_date = self.as_of_date - timedelta(days=int(np.random.uniform(0, maturity_days * 0.8)))
-            maturity_date = start_date + timedelta(days=maturity_days)
-
-            # Процентная ставка
-            if currency == 'RUB':
-                base_rate = 16.0 if self.as_of_date.year >= 2024 else 7.5
-            elif currency == 'USD':
-                base_rate = 5.5
-            elif currency == 'EUR':
-                base_rate = 4.0
-            else:  # CNY
-                base_rate = 3.5
-
-            # Добавляем спред в зависимости от типа заемщика
-            if cpty_type == 'retail':
-                spread = np.random.uniform(2.0, 8.0)
-            elif cpty_type == 'corporate':
-                spread = np.random.uniform(1.0, 5.0)
-            else:
-                spread = np.random.uniform(0.0, 2.0)
-
-            interest_rate = (base_rate + spread) / 100
-
-            # Repricing date (для плавающей ставки ~30% кредитов)
-            if np.random.rand() < 0.3:
-                repricing_days = int(np.random.choice([90, 180, 365]))
-                repricing_date = self.as_of_date + timedelta(days=repricing_days)
-            else:
-                repricing_date = maturity_date  # Фиксированная ставка
-
-            # Определяем торговый портфель
-            is_short_term = maturity_days < 365
-            trading_portfolio = self._assign_trading_portfolio('loan', cpty_type, is_short_term)
-
-            loan = {
-                'instrument_id': f'LOAN_{i:08d}',
-                'instrument_type': 'loan',
-                'balance_account': np.random.choice(self.balance_accounts['loan']),
-                'amount': float(amount),
-                'currency': currency,
-                'start_date': start_date.isoformat(),
-                'maturity_date': maturity_date.isoformat() if maturity_date > self.as_of_date else None,
-                'interest_rate': interest_rate,
-                'counterparty_id': f'CPTY_{cpty_type.upper()}_{i % 10000:05d}',
-                'counterparty_type': cpty_type,
-                'as_of_date': self.as_of_date.isoformat(),
-                'repricing_date': repricing_date.isoformat() if repricing_date and repricing_date > self.as_of_date else None,
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            loans.append(loan)
-
-        return pd.DataFrame(loans)
+        rng = self._rngs['loans']
+
+        # Все поля генерируются колонками: по одному вызову генератора на поле,
+        # параметры по типу заемщика выбираются индексом типа из таблиц
+
+        # Тип заемщика: retail, corporate, government
+        cpty_types = np.array(['retail', 'corporate', 'government'], dtype=object)
+        cpty_idx = self._sample_codes(rng, [0.60, 0.35, 0.05], count)
+        cpty_type = self._categorical(cpty_types, cpty_idx)
+        is_retail = cpty_idx == 0
+
+        # Сумма кредита зависит от типа заемщика
+        # (retail ~450k, corporate ~9M, government ~65M RUB в среднем)
+        amount = self._truncated_lognormal(
+            rng,
+            mean=np.array([13.0, 16.0, 18.0])[cpty_idx],
+            sigma=np.array([1.5, 2.0, 1.5])[cpty_idx],
+            low=np.array([50_000, 500_000, 10_000_000])[cpty_idx],
+            high=np.array([50_000_000, 5_000_000_000, 10_000_000_000])[cpty_idx]
+        )
+
+        # Валюта
+        currency_idx = self._sample_codes(rng, CURRENCY_WEIGHTS, count)
+        currency = self._categorical(CURRENCIES, currency_idx)
+        amount = amount / FX_DIVISORS[currency_idx]  # Convert to USD-equivalent
+
+        # Срок кредита: розница - ипотека 10-30 лет (30%) или потреб 6 мес - 5 лет;
+        # корпоративные 1-10 лет; государство 5-20 лет
+        is_mortgage = is_retail & (rng.random(count) < 0.3)
+        term_low = np.where(is_mortgage, 3650, np.array([180, 365, 1825])[cpty_idx])
+        term_high = np.where(is_mortgage, 10950, np.array([1825, 3650, 7300])[cpty_idx])
+        maturity_days = rng.uniform(term_low, term_high).astype(np.int64)
+
+        start_offset = -rng.uniform(0, maturity_days * 0.8).astype(np.int64)
+        maturity_offset = start_offset + maturity_days
+
+        # Процентная ставка: базовая по валюте + спред по типу заемщика
+        base_rate = LOAN_BASE_RATES[self._rate_regime, currency_idx]
+        spread = rng.uniform(
+            np.array([2.0, 1.0, 0.0])[cpty_idx],
+            np.array([8.0, 5.0, 2.0])[cpty_idx]
+        )
+        interest_rate = (base_rate + spread) / 100
+
+        # Repricing date (для плавающей ставки ~30% кредитов, иначе - дата погашения)
+        is_floating = rng.random(count) < 0.3
+        repricing_offset = np.where(
+            is_floating, rng.choice([90, 180, 365], size=count), maturity_offset
+        )
+
+        # Определяем торговый портфель
+        is_short_term = maturity_days < 365
+        trading_portfolio = self._assign_trading_portfolios(rng, 'loan', count, is_retail, is_short_term)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('LOAN_', np.arange(count), 8),
+            'instrument_type': 'loan',
+            'balance_account': self._choice_categorical(rng, BALANCE_ACCOUNTS['loan'], count),
+            'amount': amount,
+            'currency': currency,
+            'start_date': self._iso_dates(start_offset),
+            'maturity_date': self._iso_dates(maturity_offset, maturity_offset > 0),
+            'interest_rate': interest_rate,
+            'counterparty_id': self._make_ids(
+                np.array([f'CPTY_{cpty.upper()}_' for cpty in cpty_types])[cpty_idx],
+                np.arange(count) % 10000, 5
+            ),
+            'counterparty_type': cpty_type,
+            'as_of_date': self._as_of_iso,
+            'repricing_date': self._iso_dates(repricing_offset, repricing_offset > 0),
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
 
     def _generate_deposits(self, count: int) -> pd.DataFrame:
         """Генерирует депозиты"""
         logger.info(f"Generating {count} deposits")
-
-        deposits = []
-        for i in range(count):
-            # Тип вкладчика
-            cpty_type = np.random.choice(
-                ['retail', 'corporate', 'government'],
-                p=[0.55, 0.40, 0.05]
-            )
-
-            # Тип депозита: срочный или до востребования (NMD)
-            is_demand = np.random.rand() < 0.30  # 30% - до востребования
-
-            # Сумма депозита
-            if cpty_type == 'retail':
-                if is_demand:
-                    amount = np.random.lognormal(mean=11.5, sigma=2.0)  # ~100k RUB average
-                else:
-                    amount = np.random.lognormal(mean=12.5, sigma=1.8)  # ~300k RUB average
-                min_amount, max_amount = 1_000, 20_000_000
-            elif cpty_type == 'corporate':
-                if is_demand:
-                    amount = np.random.lognormal(mean=14.5, sigma=2.5)  # ~2M RUB average
-                else:
-                    amount = np.random.lognormal(mean=15.5, sigma=2.0)  # ~5M RUB average
-                min_amount, max_amount = 10_000, 2_000_000_000
-            else:  # government
-                amount = np.random.lognormal(mean=17.0, sigma=1.5)  # ~25M RUB average
-                min_amount, max_amount = 1_000_000, 5_000_000_000
-
-            amount = np.clip(amount, min_amount, max_amount)
-
-            # Валюта
-            currency = np.random.choice(self.currencies, p=self.currency_weights)
-            if currency != 'RUB':
-                amount = amount / 85
-
-            # Даты
-            if is_demand:
-                maturity_date = None
-                # NMD параметры
-                if cpty_type == 'retail':
-                    core_portion = np.random.uniform(0.60, 0.80)
-                    avg_life_years = np.random.uniform(2.0, 4.0)
-                elif cpty_type == 'corporate':
-                    core_portion = np.random.uniform(0.30, 0.50)
-                    avg_life_years = np.random.uniform(0.5, 2.0)
-                else:  # government
-                    core_portion = np.random.uniform(0.70, 0.90)
-                    avg_life_years = np.random.uniform(1.0, 3.0)
-
-                withdrawal_rates = {
-                    '0-30d': np.random.uniform(0.05, 0.15),
-                    '30-90d': np.random.uniform(0.05, 0.15),
-                    '90-180d': np.random.uniform(0.02, 0.08),
-                }
-            else:
-                # Срочный депозит
-                if cpty_type == 'retail':
-                    maturity_days = int(np.random.choice([90, 180, 365, 730, 1095], p=[0.3, 0.3, 0.25, 0.1, 0.05]))
-                elif cpty_type == 'corporate':
-                    maturity_days = int(np.random.choice([30, 90, 180, 365], p=[0.2, 0.4, 0.3, 0.1]))
-                else:  # government
-                    maturity_days = int(np.random.choice([180, 365, 730], p=[0.3, 0.5, 0.2]))
-
-                start_date = self.as_of_date - timedelta(days=int(np.random.uniform(0, maturity_days * 0.7)))
-                maturity_date = start_date + timedelta(days=maturity_days)
-                core_portion = None
-                avg_life_years = None
-                withdrawal_rates = {}
-
-            # Процентная ставка
-            if currency == 'RUB':
-                base_rate = 15.0 if self.as_of_date.year >= 2024 else 6.5
-            elif currency == 'USD':
-                base_rate = 4.5
-            elif currency == 'EUR':
-                base_rate = 3.0
-            else:  # CNY
-                base_rate = 2.5
-
-            # Депозиты - ниже кредитных ставок
-            if is_demand:
-                interest_rate = (base_rate - np.random.uniform(3.0, 6.0)) / 100
-                interest_rate = max(interest_rate, 0.001)  # Минимум 0.1%
-            else:
-                spread = np.random.uniform(-2.0, 1.0)
-                interest_rate = (base_rate + spread) / 100
-                interest_rate = max(interest_rate, 0.5 / 100)
-
-            # Определяем торговый портфель
-            is_short_term = not is_demand and maturity_days < 365 if not is_demand else False
-            trading_portfolio = self._assign_trading_portfolio('deposit', cpty_type, is_short_term)
-
-            deposit = {
-                'instrument_id': f'DEPO_{i:08d}',
-                'instrument_type': 'deposit',
-                'balance_account': np.random.choice(self.balance_accounts['deposit']),
-                'amount': float(amount),
-                'currency': currency,
-                'start_date': (start_date if not is_demand else self.as_of_date - timedelta(days=int(np.random.uniform(0, 1095)))).isoformat(),
-                'maturity_date': maturity_date.isoformat() if maturity_date and maturity_date > self.as_of_date else None,
-                'interest_rate': interest_rate,
-                'counterparty_id': f'CPTY_{cpty_type.upper()}_{i % 15000:05d}',
-                'counterparty_type': cpty_type,
-                'as_of_date': self.as_of_date.isoformat(),
-                'is_demand_deposit': is_demand,
-                'core_portion': core_portion,
-                'avg_life_years': avg_life_years,
-                'withdrawal_rates': str(withdrawal_rates) if withdrawal_rates else None,
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            deposits.append(deposit)
-
-        return pd.DataFrame(deposits)
+        rng = self._rngs['deposits']
+
+        # Тип вкладчика: retail, corporate, government
+        cpty_types = np.array(['retail', 'corporate', 'government'], dtype=object)
+        cpty_idx = self._sample_codes(rng, [0.55, 0.40, 0.05], count)
+        cpty_type = self._categorical(cpty_types, cpty_idx)
+
+        # Тип депозита: срочный или до востребования (NMD, 30%)
+        is_demand = rng.random(count) < 0.30
+        demand_idx = is_demand.astype(np.int64)
+
+        # Сумма депозита: параметры по [срочный/до востребования, тип вкладчика]
+        # (retail ~300k/~100k, corporate ~5M/~2M, government ~25M RUB в среднем)
+        amount = self._truncated_lognormal(
+            rng,
+            mean=np.array([[12.5, 15.5, 17.0], [11.5, 14.5, 17.0]])[demand_idx, cpty_idx],
+            sigma=np.array([[1.8, 2.0, 1.5], [2.0, 2.5, 1.5]])[demand_idx, cpty_idx],
+            low=np.array([1_000, 10_000, 1_000_000])[cpty_idx],
+            high=np.array([20_000_000, 2_000_000_000, 5_000_000_000])[cpty_idx]
+        )
+
+        # Валюта
+        currency_idx = self._sample_codes(rng, CURRENCY_WEIGHTS, count)
+        currency = self._categorical(CURRENCIES, currency_idx)
+        amount = amount / FX_DIVISORS[currency_idx]
+
+        # NMD параметры (только для депозитов до востребования)
+        core_portion = rng.uniform(
+            np.array([0.60, 0.30, 0.70])[cpty_idx], np.array([0.80, 0.50, 0.90])[cpty_idx]
+        )
+        avg_life_years = rng.uniform(
+            np.array([2.0, 0.5, 1.0])[cpty_idx], np.array([4.0, 2.0, 3.0])[cpty_idx]
+        )
+        # Доли оттока по корзинам - отдельная числовая колонка на корзину
+        withdrawal_0_30d = rng.uniform(0.05, 0.15, size=count)
+        withdrawal_30_90d = rng.uniform(0.05, 0.15, size=count)
+        withdrawal_90_180d = rng.uniform(0.02, 0.08, size=count)
+
+        # Срок срочного депозита: свое распределение для каждого типа вкладчика
+        # (строки таблиц дополнены сроками с нулевой вероятностью)
+        term_days = np.array([
+            [90, 180, 365, 730, 1095],  # retail
+            [30, 90, 180, 365, 365],  # corporate
+            [180, 365, 730, 730, 730],  # government
+        ])
+        term_probs = np.array([
+            [0.3, 0.3, 0.25, 0.1, 0.05],
+            [0.2, 0.4, 0.3, 0.1, 0.0],
+            [0.3, 0.5, 0.2, 0.0, 0.0],
+        ])
+        term_idx = self._sample_codes(rng, term_probs, count, rows=cpty_idx)
+        maturity_days = term_days[cpty_idx, term_idx]
+
+        # Даты: у срочных старт в пределах 70% срока, у NMD - до 3 лет назад
+        start_offset = -np.where(
+            is_demand,
+            rng.uniform(0, 1095, size=count),
+            rng.uniform(0, maturity_days * 0.7)
+        ).astype(np.int64)
+        maturity_offset = start_offset + maturity_days
+
+        # Процентная ставка (депозиты - ниже кредитных ставок)
+        base_rate = DEPOSIT_BASE_RATES[self._rate_regime, currency_idx]
+        interest_rate = np.where(
+            is_demand,
+            np.maximum((base_rate - rng.uniform(3.0, 6.0, size=count)) / 100, 0.001),
+            np.maximum((base_rate + rng.uniform(-2.0, 1.0, size=count)) / 100, 0.5 / 100)
+        )
+
+        # Определяем торговый портфель
+        is_short_term = ~is_demand & (maturity_days < 365)
+        trading_portfolio = self._assign_trading_portfolios(rng, 'deposit', count, cpty_idx == 0, is_short_term)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('DEPO_', np.arange(count), 8),
+            'instrument_type': 'deposit',
+            'balance_account': self._choice_categorical(rng, BALANCE_ACCOUNTS['deposit'], count),
+            'amount': amount,
+            'currency': currency,
+            'start_date': self._iso_dates(start_offset),
+            'maturity_date': self._iso_dates(maturity_offset, ~is_demand & (maturity_offset > 0)),
+            'interest_rate': interest_rate,
+            'counterparty_id': self._make_ids(
+                np.array([f'CPTY_{cpty.upper()}_' for cpty in cpty_types])[cpty_idx],
+                np.arange(count) % 15000, 5
+            ),
+            'counterparty_type': cpty_type,
+            'as_of_date': self._as_of_iso,
+            'is_demand_deposit': is_demand,
+            'core_portion': np.where(is_demand, core_portion, np.nan),
+            'avg_life_years': np.where(is_demand, avg_life_years, np.nan),
+            'withdrawal_rate_0_30d': np.where(is_demand, withdrawal_0_30d, np.nan),
+            'withdrawal_rate_30_90d': np.where(is_demand, withdrawal_30_90d, np.nan),
+            'withdrawal_rate_90_180d': np.where(is_demand, withdrawal_90_180d, np.nan),
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
 
     def _generate_interbank(self, count: int) -> pd.DataFrame:
         """Генерирует межбанковские кредиты (МБК)"""
         logger.info(f"Generating {count} interbank loans")
+        rng = self._rngs['interbank']
+
+        # Направление: размещение (актив) или привлечение (пассив), 50/50
+        is_placement = rng.random(count) < 0.50
+
+        # Сумма МБК (обычно крупные суммы, ~24M RUB в среднем)
+        amount = self._truncated_lognormal(rng, 17.0, 1.5, 5_000_000, 10_000_000_000, size=count)
+
+        # Валюта (МБК чаще в RUB или USD)
+        currency_idx = self._sample_codes(rng, [0.70, 0.20, 0.10], count)
+        currency = self._categorical(['RUB', 'USD', 'EUR'], currency_idx)
+        amount = amount / FX_DIVISORS[currency_idx]
+
+        # Срок МБК (обычно краткосрочные)
+        maturity_days = np.array([1, 7, 14, 30, 90, 180, 365])[
+            self._sample_codes(rng, [0.15, 0.20, 0.15, 0.20, 0.15, 0.10, 0.05], count)
+        ]
 
-        interbank = []
-        for i in range(count):
-            # Направление: размещение (актив) или привлечение (пассив)
-            is_placement = np.random.rand() < 0.50  # 50/50
-
-            # Сумма МБК (обычно крупные суммы)
-            amount = np.random.lognormal(mean=17.0, sigma=1.5)  # ~24M RUB average
-            amount = np.clip(amount, 5_000_000, 10_000_000_000)
-
-            # Валюта (МБК чаще в RUB или USD)
-            currency = np.random.choice(['RUB', 'USD', 'EUR'], p=[0.70, 0.20, 0.10])
-            if currency != 'RUB':
-                amount = amount / 85
-
-            # Срок МБК (обычно краткосрочные)
-            maturity_days = int(np.random.choice([1, 7, 14, 30, 90, 180, 365], p=[0.15, 0.20, 0.15, 0.20, 0.15, 0.10, 0.05]))
-
-            start_date = self.as_of_date - timedelta(days=int(np.random.uniform(0, min(maturity_days, 30))))
-            maturity_date = start_date + timedelta(days=maturity_days)
-
-            # Процентная ставка
-            if currency == 'RUB':
-                base_rate = 16.0 if self.as_of_date.year >= 2024 else 7.0
-            elif currency == 'USD':
-                base_rate = 5.5
-            else:  # EUR
-                base_rate = 4.0
-
-            spread = np.random.uniform(-0.5, 1.5)
-            interest_rate = (base_rate + spread) / 100
-
-            # Определяем торговый портфель
-            is_short_term = maturity_days <= 90
-            trading_portfolio = self._assign_trading_portfolio('interbank', 'bank', is_short_term)
-
-            mbk = {
-                'instrument_id': f'MBK_{i:08d}',
-                'instrument_type': 'interbank_loan',
-                'balance_account': np.random.choice(self.balance_accounts['interbank_loan']),
-                'amount': float(amount) if is_placement else float(-amount),
-                'currency': currency,
-                'start_date': start_date.isoformat(),
-                'maturity_date': maturity_date.isoformat() if maturity_date > self.as_of_date else None,
-                'interest_rate': interest_rate,
-                'counterparty_id': f'BANK_{i % 100:03d}',
-                'counterparty_type': 'bank',
-                'as_of_date': self.as_of_date.isoformat(),
-                'is_placement': is_placement,
-                'counterparty_bank': f'Bank_{i % 100:03d}',
-                'credit_rating': np.random.choice(['AAA', 'AA', 'A', 'BBB', 'BB'], p=[0.05, 0.15, 0.40, 0.30, 0.10]),
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            interbank.append(mbk)
-
-        return pd.DataFrame(interbank)
+        start_offset = -rng.uniform(0, np.minimum(maturity_days, 30)).astype(np.int64)
+        maturity_offset = start_offset + maturity_days
+
+        # Процентная ставка
+        base_rate = INTERBANK_BASE_RATES[self._rate_regime, currency_idx]
+        spread = rng.uniform(-0.5, 1.5, size=count)
+        interest_rate = (base_rate + spread) / 100
+
+        # Определяем торговый портфель
+        is_short_term = maturity_days <= 90
+        trading_portfolio = self._assign_trading_portfolios(rng, 'interbank', count, is_short_term=is_short_term)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('MBK_', np.arange(count), 8),
+            'instrument_type': 'interbank_loan',
+            'balance_account': self._choice_categorical(rng, BALANCE_ACCOUNTS['interbank_loan'], count),
+            'amount': np.where(is_placement, amount, -amount),
+            'currency': currency,
+            'start_date': self._iso_dates(start_offset),
+            'maturity_date': self._iso_dates(maturity_offset, maturity_offset > 0),
+            'interest_rate': interest_rate,
+            'counterparty_id': self._make_ids('BANK_', np.arange(count) % 100, 3),
+            'counterparty_type': 'bank',
+            'as_of_date': self._as_of_iso,
+            'is_placement': is_placement,
+            'counterparty_bank': self._make_ids('Bank_', np.arange(count) % 100, 3),
+            'credit_rating': self._choice_categorical(
+                rng, ['AAA', 'AA', 'A', 'BBB', 'BB'], count, p=[0.05, 0.15, 0.40, 0.30, 0.10]
+            ),
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
 
     def _generate_repo(self, count: int) -> pd.DataFrame:
         """Генерирует прямые РЕПО"""
         logger.info(f"Generating {count} REPO transactions")
+        rng = self._rngs['repo']
+
+        # Сумма РЕПО (~40M RUB в среднем)
+        amount = self._truncated_lognormal(rng, 17.5, 1.5, 10_000_000, 50_000_000_000, size=count)
+
+        # Валюта (РЕПО преимущественно в RUB)
+        currency_idx = self._sample_codes(rng, [0.90, 0.10], count)
+        currency = self._categorical(['RUB', 'USD'], currency_idx)
+        amount = amount / FX_DIVISORS[currency_idx]
+
+        # Срок РЕПО (обычно очень короткие)
+        maturity_days = np.array([1, 2, 7, 14, 30, 90])[
+            self._sample_codes(rng, [0.30, 0.20, 0.20, 0.15, 0.10, 0.05], count)
+        ]
 
-        repos = []
-        for i in range(count):
-            # Сумма РЕПО
-            amount = np.random.lognormal(mean=17.5, sigma=1.5)  # ~40M RUB average
-            amount = np.clip(amount, 10_000_000, 50_000_000_000)
-
-            # Валюта (РЕПО преимущественно в RUB)
-            currency = np.random.choice(['RUB', 'USD'], p=[0.90, 0.10])
-            if currency != 'RUB':
-                amount = amount / 85
-
-            # Срок РЕПО (обычно очень короткие)
-            maturity_days = int(np.random.choice([1, 2, 7, 14, 30, 90], p=[0.30, 0.20, 0.20, 0.15, 0.10, 0.05]))
-
-            start_date = self.as_of_date - timedelta(days=int(np.random.uniform(0, min(maturity_days, 7))))
-            maturity_date = start_date + timedelta(days=maturity_days)
-
-            # Ставка РЕПО
-            if currency == 'RUB':
-                base_rate = 16.0 if self.as_of_date.year >= 2024 else 7.0
-            else:  # USD
-                base_rate = 5.5
-
-            repo_rate = (base_rate + np.random.uniform(-0.5, 0.5)) / 100
-
-            # Обеспечение
-            collateral_type = np.random.choice(['OFZ', 'Corporate_Bonds', 'Bank_Bonds'], p=[0.60, 0.30, 0.10])
-            haircut = np.random.uniform(0.05, 0.20) if collateral_type == 'Corporate_Bonds' else np.random.uniform(0.0, 0.10)
-            collateral_value = amount * (1 + haircut)
-
-            # Определяем торговый портфель (РЕПО часто в торговой книге)
-            is_short_term = maturity_days <= 30
-            trading_portfolio = self._assign_trading_portfolio('repo', 'bank', is_short_term)
-
-            repo = {
-                'instrument_id': f'REPO_{i:08d}',
-                'instrument_type': 'repo',
-                'balance_account': np.random.choice(self.balance_accounts['repo']),
-                'amount': float(amount),
-                'currency': currency,
-                'start_date': start_date.isoformat(),
-                'maturity_date': maturity_date.isoformat() if maturity_date > self.as_of_date else None,
-                'interest_rate': repo_rate,
-                'counterparty_id': f'REPO_CPTY_{i % 50:03d}',
-                'counterparty_type': 'bank',
-                'as_of_date': self.as_of_date.isoformat(),
-                'repo_rate': repo_rate,
-                'collateral_type': collateral_type,
-                'collateral_value': float(collateral_value),
-                'haircut': haircut,
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            repos.append(repo)
-
-        return pd.DataFrame(repos)
+        start_offset = -rng.uniform(0, np.minimum(maturity_days, 7)).astype(np.int64)
+        maturity_offset = start_offset + maturity_days
+
+        # Ставка РЕПО
+        base_rate = REPO_BASE_RATES[self._rate_regime, currency_idx]
+        repo_rate = (base_rate + rng.uniform(-0.5, 0.5, size=count)) / 100
+
+        # Обеспечение: дисконт выше для корпоративных облигаций
+        collateral_type = self._choice_categorical(
+            rng, ['OFZ', 'Corporate_Bonds', 'Bank_Bonds'], count, p=[0.60, 0.30, 0.10]
+        )
+        haircut = np.where(
+            collateral_type == 'Corporate_Bonds',
+            rng.uniform(0.05, 0.20, size=count),
+            rng.uniform(0.0, 0.10, size=count)
+        )
+        collateral_value = amount * (1 + haircut)
+
+        # Определяем торговый портфель (РЕПО часто в торговой книге)
+        is_short_term = maturity_days <= 30
+        trading_portfolio = self._assign_trading_portfolios(rng, 'repo', count, is_short_term=is_short_term)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('REPO_', np.arange(count), 8),
+            'instrument_type': 'repo',
+            'balance_account': self._choice_categorical(rng, BALANCE_ACCOUNTS['repo'], count),
+            'amount': amount,
+            'currency': currency,
+            'start_date': self._iso_dates(start_offset),
+            'maturity_date': self._iso_dates(maturity_offset, maturity_offset > 0),
+            'interest_rate': repo_rate,
+            'counterparty_id': self._make_ids('REPO_CPTY_', np.arange(count) % 50, 3),
+            'counterparty_type': 'bank',
+            'as_of_date': self._as_of_iso,
+            'repo_rate': repo_rate,
+            'collateral_type': collateral_type,
+            'collateral_value': collateral_value,
+            'haircut': haircut,
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
 
     def _generate_reverse_repo(self, count: int) -> pd.DataFrame:
         """Генерирует обратные РЕПО"""
         logger.info(f"Generating {count} Reverse REPO transactions")
+        rng = self._rngs['reverse_repo']
 
-        reverse_repos = []
-        for i in range(count):
-            # Сумма обратного РЕПО
-            amount = np.random.lognormal(mean=17.3, sigma=1.5)  # ~30M RUB average
-            amount = np.clip(amount, 5_000_000, 30_000_000_000)
+        # Сумма обратного РЕПО (~30M RUB в среднем)
+        amount = self._truncated_lognormal(rng, 17.3, 1.5, 5_000_000, 30_000_000_000, size=count)
 
-            # Валюта
-            currency = np.random.choice(['RUB', 'USD'], p=[0.85, 0.15])
-            if currency != 'RUB':
-                amount = amount / 85
+        # Валюта
+        currency_idx = self._sample_codes(rng, [0.85, 0.15], count)
+        currency = self._categorical(['RUB', 'USD'], currency_idx)
+        amount = amount / FX_DIVISORS[currency_idx]
 
-            # Срок
-            maturity_days = int(np.random.choice([1, 2, 7, 14, 30], p=[0.25, 0.20, 0.25, 0.20, 0.10]))
-
-            start_date = self.as_of_date - timedelta(days=int(np.random.uniform(0, min(maturity_days, 7))))
-            maturity_date = start_date + timedelta(days=maturity_days)
+        # Срок
+        maturity_days = np.array([1, 2, 7, 14, 30])[
+            self._sample_codes(rng, [0.25, 0.20, 0.25, 0.20, 0.10], count)
+        ]
 
-            # Ставка РЕПО
-            if currency == 'RUB':
-                base_rate = 16.0 if self.as_of_date.year >= 2024 else 7.0
-            else:
-                base_rate = 5.5
-
-            repo_rate = (base_rate + np.random.uniform(-1.0, 0.0)) / 100  # Размещение - ниже ставки
-
-            # Обеспечение
-            collateral_type = np.random.choice(['OFZ', 'Corporate_Bonds', 'CBR_Bonds'], p=[0.50, 0.30, 0.20])
-            haircut = np.random.uniform(0.05, 0.15) if collateral_type == 'Corporate_Bonds' else np.random.uniform(0.0, 0.08)
-            collateral_value = amount * (1 + haircut)
-
-            # Определяем торговый портфель
-            is_short_term = maturity_days <= 30
-            trading_portfolio = self._assign_trading_portfolio('reverse_repo', 'bank', is_short_term)
-
-            rrepo = {
-                'instrument_id': f'RREPO_{i:08d}',
-                'instrument_type': 'reverse_repo',
-                'balance_account': np.random.choice(self.balance_accounts['reverse_repo']),
-                'amount': float(amount),
-                'currency': currency,
-                'start_date': start_date.isoformat(),
-                'maturity_date': maturity_date.isoformat() if maturity_date > self.as_of_date else None,
-                'interest_rate': repo_rate,
-                'counterparty_id': f'RREPO_CPTY_{i % 40:03d}',
-                'counterparty_type': 'bank',
-                'as_of_date': self.as_of_date.isoformat(),
-                'repo_rate': repo_rate,
-                'collateral_type': collateral_type,
-                'collateral_value': float(collateral_value),
-                'haircut': haircut,
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            reverse_repos.append(rrepo)
-
-        return pd.DataFrame(reverse_repos)
+        start_offset = -rng.uniform(0, np.minimum(maturity_days, 7)).astype(np.int64)
+        maturity_offset = start_offset + maturity_days
+
+        # Ставка РЕПО (размещение - ниже ставки)
+        base_rate = REPO_BASE_RATES[self._rate_regime, currency_idx]
+        repo_rate = (base_rate + rng.uniform(-1.0, 0.0, size=count)) / 100
+
+        # Обеспечение: дисконт выше для корпоративных облигаций
+        collateral_type = self._choice_categorical(
+            rng, ['OFZ', 'Corporate_Bonds', 'CBR_Bonds'], count, p=[0.50, 0.30, 0.20]
+        )
+        haircut = np.where(
+            collateral_type == 'Corporate_Bonds',
+            rng.uniform(0.05, 0.15, size=count),
+            rng.uniform(0.0, 0.08, size=count)
+        )
+        collateral_value = amount * (1 + haircut)
+
+        # Определяем торговый портфель
+        is_short_term = maturity_days <= 30
+        trading_portfolio = self._assign_trading_portfolios(rng, 'reverse_repo', count, is_short_term=is_short_term)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('RREPO_', np.arange(count), 8),
+            'instrument_type': 'reverse_repo',
+            'balance_account': self._choice_categorical(rng, BALANCE_ACCOUNTS['reverse_repo'], count),
+            'amount': amount,
+            'currency': currency,
+            'start_date': self._iso_dates(start_offset),
+            'maturity_date': self._iso_dates(maturity_offset, maturity_offset > 0),
+            'interest_rate': repo_rate,
+            'counterparty_id': self._make_ids('RREPO_CPTY_', np.arange(count) % 40, 3),
+            'counterparty_type': 'bank',
+            'as_of_date': self._as_of_iso,
+            'repo_rate': repo_rate,
+            'collateral_type': collateral_type,
+            'collateral_value': collateral_value,
+            'haircut': haircut,
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
 
     def _generate_current_accounts(self, count: int) -> pd.DataFrame:
         """Генерирует текущие счета"""
         logger.info(f"Generating {count} current accounts")
-
-        current_accounts = []
-        for i in range(count):
-            # Тип владельца счета
-            cpty_type = np.random.choice(['retail', 'corporate', 'government'], p=[0.50, 0.45, 0.05])
-
-            # Сумма на счете
-            if cpty_type == 'retail':
-                amount = np.random.lognormal(mean=10.5, sigma=2.5)  # ~37k RUB average
-                amount = np.clip(amount, 100, 10_000_000)
-            elif cpty_type == 'corporate':
-                amount = np.random.lognormal(mean=14.0, sigma=2.5)  # ~1.2M RUB average
-                amount = np.clip(amount, 1_000, 500_000_000)
-            else:  # government
-                amount = np.random.lognormal(mean=16.0, sigma=2.0)  # ~9M RUB average
-                amount = np.clip(amount, 100_000, 2_000_000_000)
-
-            # Валюта
-            currency = np.random.choice(self.currencies, p=[0.85, 0.08, 0.05, 0.02])
-            if currency != 'RUB':
-                amount = amount / 85
-
-            # Stable portion зависит от типа
-            if cpty_type == 'retail':
-                stable_portion = np.random.uniform(0.50, 0.70)
-                avg_life_days = int(np.random.uniform(180, 365))
-            elif cpty_type == 'corporate':
-                stable_portion = np.random.uniform(0.30, 0.50)
-                avg_life_days = int(np.random.uniform(90, 270))
-            else:  # government
-                stable_portion = np.random.uniform(0.70, 0.90)
-                avg_life_days = int(np.random.uniform(180, 365))
-
-            # Процентная ставка (обычно низкая или 0)
-            interest_rate = np.random.uniform(0.0, 0.5) / 100
-
-            # Определяем торговый портфель (текущие счета всегда в банковской книге)
-            trading_portfolio = self._assign_trading_portfolio('current_account', cpty_type, False)
-
-            current_acc = {
-                'instrument_id': f'CURR_ACC_{i:08d}',
-                'instrument_type': 'current_account',
-                'balance_account': np.random.choice(self.balance_accounts['current_account']),
-                'amount': float(amount),
-                'currency': currency,
-                'start_date': (self.as_of_date - timedelta(days=int(np.random.uniform(30, 1825)))).isoformat(),
-                'maturity_date': None,
-                'interest_rate': interest_rate,
-                'counterparty_id': f'CPTY_{cpty_type.upper()}_{i % 20000:05d}',
-                'counterparty_type': cpty_type,
-                'as_of_date': self.as_of_date.isoformat(),
-                'is_transactional': True,
-                'stable_portion': stable_portion,
-                'avg_life_days': avg_life_days,
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            current_accounts.append(current_acc)
-
-        return pd.DataFrame(current_accounts)
+        rng = self._rngs['current_accounts']
+
+        # Тип владельца счета: retail, corporate, government
+        cpty_types = np.array(['retail', 'corporate', 'government'], dtype=object)
+        cpty_idx = self._sample_codes(rng, [0.50, 0.45, 0.05], count)
+        cpty_type = self._categorical(cpty_types, cpty_idx)
+
+        # Сумма на счете (retail ~37k, corporate ~1.2M, government ~9M RUB в среднем)
+        amount = self._truncated_lognormal(
+            rng,
+            mean=np.array([10.5, 14.0, 16.0])[cpty_idx],
+            sigma=np.array([2.5, 2.5, 2.0])[cpty_idx],
+            low=np.array([100, 1_000, 100_000])[cpty_idx],
+            high=np.array([10_000_000, 500_000_000, 2_000_000_000])[cpty_idx]
+        )
+
+        # Валюта
+        currency_idx = self._sample_codes(rng, [0.85, 0.08, 0.05, 0.02], count)
+        currency = self._categorical(CURRENCIES, currency_idx)
+        amount = amount / FX_DIVISORS[currency_idx]
+
+        # Stable portion и средний срок жизни зависят от типа
+        stable_portion = rng.uniform(
+            np.array([0.50, 0.30, 0.70])[cpty_idx], np.array([0.70, 0.50, 0.90])[cpty_idx]
+        )
+        avg_life_days = rng.uniform(
+            np.array([180, 90, 180])[cpty_idx], np.array([365, 270, 365])[cpty_idx]
+        ).astype(np.int64)
+
+        # Процентная ставка (обычно низкая или 0)
+        interest_rate = rng.uniform(0.0, 0.5, size=count) / 100
+
+        # Определяем торговый портфель (текущие счета всегда в банковской книге)
+        trading_portfolio = self._assign_trading_portfolios(rng, 'current_account', count, cpty_idx == 0)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('CURR_ACC_', np.arange(count), 8),
+            'instrument_type': 'current_account',
+            'balance_account': self._choice_categorical(rng, BALANCE_ACCOUNTS['current_account'], count),
+            'amount': amount,
+            'currency': currency,
+            'start_date': self._iso_dates(
+                -rng.uniform(30, 1825, size=count).astype(np.int64)
+            ),
+            'maturity_date': None,
+            'interest_rate': interest_rate,
+            'counterparty_id': self._make_ids(
+                np.array([f'CPTY_{cpty.upper()}_' for cpty in cpty_types])[cpty_idx],
+                np.arange(count) % 20000, 5
+            ),
+            'counterparty_type': cpty_type,
+            'as_of_date': self._as_of_iso,
+            'is_transactional': True,
+            'stable_portion': stable_portion,
+            'avg_life_days': avg_life_days,
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
 
     def _generate_correspondent_accounts(self, count: int) -> pd.DataFrame:
         """Генерирует корреспондентские счета"""
         logger.info(f"Generating {count} correspondent accounts")
-
-        corr_accounts = []
-        for i in range(count):
-            # Тип корсчета
-            account_type = np.random.choice(
-                ['nostro', 'loro', 'cbr_required_reserve', 'cbr_operational'],
-                p=[0.40, 0.30, 0.15, 0.15]
-            )
-
-            # Сумма
-            if account_type == 'cbr_required_reserve':
-                # Обязательные резервы - крупные суммы
-                amount = np.random.lognormal(mean=18.0, sigma=1.0)  # ~65M RUB
-                amount = np.clip(amount, 10_000_000, 100_000_000_000)
-            elif account_type == 'cbr_operational':
-                # Операционный остаток в ЦБ
-                amount = np.random.lognormal(mean=17.0, sigma=1.5)  # ~24M RUB
-                amount = np.clip(amount, 1_000_000, 50_000_000_000)
-            elif account_type == 'nostro':
-                # НОСТРО счета
-                amount = np.random.lognormal(mean=16.0, sigma=2.0)  # ~9M RUB
-                amount = np.clip(amount, 100_000, 10_000_000_000)
-            else:  # loro
-                # ЛОРО счета
-                amount = np.random.lognormal(mean=15.5, sigma=2.0)  # ~5M RUB
-                amount = np.clip(amount, 50_000, 5_000_000_000)
-
-            # Валюта
-            if account_type in ['cbr_required_reserve', 'cbr_operational']:
-                currency = 'RUB'
-            elif account_type == 'nostro':
-                currency = np.random.choice(['RUB', 'USD', 'EUR', 'CNY'], p=[0.40, 0.30, 0.20, 0.10])
-            else:  # loro
-                currency = np.random.choice(['RUB', 'USD', 'EUR'], p=[0.50, 0.30, 0.20])
-
-            if currency != 'RUB':
-                amount = amount / 85
-
-            # Процентная ставка (обычно минимальная или 0)
-            interest_rate = np.random.uniform(0.0, 0.1) / 100
-
-            # Counterparty
-            if account_type in ['cbr_required_reserve', 'cbr_operational']:
-                counterparty_id = 'CBR_001'
-                counterparty_type = 'central_bank'
-                correspondent_bank = 'Central Bank of Russia'
-            else:
-                counterparty_id = f'BANK_{i % 150:03d}'
-                counterparty_type = 'bank'
-                correspondent_bank = f'Bank_{i % 150:03d}'
-
-            # Определяем торговый портфель (корсчета всегда в банковской книге)
-            trading_portfolio = self._assign_trading_portfolio('correspondent', counterparty_type, False)
-
-            corr_acc = {
-                'instrument_id': f'CORR_ACC_{i:08d}',
-                'instrument_type': 'correspondent_account',
-                'balance_account': np.random.choice(self.balance_accounts['correspondent']),
-                'amount': float(amount) if account_type in ['nostro', 'cbr_required_reserve', 'cbr_operational'] else float(-amount),
-                'currency': currency,
-                'start_date': (self.as_of_date - timedelta(days=int(np.random.uniform(180, 3650)))).isoformat(),
-                'maturity_date': None,
-                'interest_rate': interest_rate,
-                'counterparty_id': counterparty_id,
-                'counterparty_type': counterparty_type,
-                'as_of_date': self.as_of_date.isoformat(),
-                'account_type': account_type,
-                'correspondent_bank': correspondent_bank,
-                'is_required_reserve': account_type == 'cbr_required_reserve',
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            corr_accounts.append(corr_acc)
-
-        return pd.DataFrame(corr_accounts)
+        rng = self._rngs['correspondent_accounts']
+
+        # Тип корсчета: nostro, loro, cbr_required_reserve, cbr_operational
+        account_types = np.array(
+            ['nostro', 'loro', 'cbr_required_reserve', 'cbr_operational'], dtype=object
+        )
+        type_idx = self._sample_codes(rng, [0.40, 0.30, 0.15, 0.15], count)
+        account_type = self._categorical(account_types, type_idx)
+        is_loro = type_idx == 1
+        is_cbr = type_idx >= 2
+
+        # Сумма: НОСТРО ~9M, ЛОРО ~5M, обязательные резервы ~65M,
+        # операционный остаток в ЦБ ~24M RUB
+        amount = self._truncated_lognormal(
+            rng,
+            mean=np.array([16.0, 15.5, 18.0, 17.0])[type_idx],
+            sigma=np.array([2.0, 2.0, 1.0, 1.5])[type_idx],
+            low=np.array([100_000, 50_000, 10_000_000, 1_000_000])[type_idx],
+            high=np.array([10_000_000_000, 5_000_000_000, 100_000_000_000, 50_000_000_000])[type_idx]
+        )
+
+        # Валюта: счета в ЦБ - только RUB, НОСТРО и ЛОРО - со своим распределением
+        currency_idx = np.where(
+            is_loro,
+            self._sample_codes(rng, [0.50, 0.30, 0.20], count),
+            self._sample_codes(rng, [0.40, 0.30, 0.20, 0.10], count)
+        )
+        currency_idx[is_cbr] = 0
+        currency = self._categorical(CURRENCIES, currency_idx)
+        amount = amount / FX_DIVISORS[currency_idx]
+
+        # Процентная ставка (обычно минимальная или 0)
+        interest_rate = rng.uniform(0.0, 0.1, size=count) / 100
+
+        # Counterparty
+        bank_ids = np.arange(count) % 150
+        counterparty_id = self._make_ids('BANK_', bank_ids, 3)
+        counterparty_id[is_cbr] = 'CBR_001'
+        counterparty_type = self._categorical(['bank', 'central_bank'], is_cbr.astype(np.int8))
+        correspondent_bank = self._make_ids('Bank_', bank_ids, 3)
+        correspondent_bank[is_cbr] = 'Central Bank of Russia'
+
+        # Определяем торговый портфель (корсчета всегда в банковской книге)
+        trading_portfolio = self._assign_trading_portfolios(rng, 'correspondent', count)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('CORR_ACC_', np.arange(count), 8),
+            'instrument_type': 'correspondent_account',
+            'balance_account': self._choice_categorical(rng, BALANCE_ACCOUNTS['correspondent'], count),
+            'amount': np.where(is_loro, -amount, amount),
+            'currency': currency,
+            'start_date': self._iso_dates(
+                -rng.uniform(180, 3650, size=count).astype(np.int64)
+            ),
+            'maturity_date': None,
+            'interest_rate': interest_rate,
+            'counterparty_id': counterparty_id,
+            'counterparty_type': counterparty_type,
+            'as_of_date': self._as_of_iso,
+            'account_type': account_type,
+            'correspondent_bank': correspondent_bank,
+            'is_required_reserve': type_idx == 2,
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
 
     def _generate_other_assets(self, count: int) -> pd.DataFrame:
         """Генерирует прочие активы"""
         logger.info(f"Generating {count} other assets")
-
-        other_assets = []
-        for i in range(count):
-            # Категория актива
-            asset_category = np.random.choice(
-                ['fixed_assets', 'intangible', 'receivables', 'other'],
-                p=[0.40, 0.20, 0.30, 0.10]
-            )
-
-            # Сумма
-            if asset_category == 'fixed_assets':
-                amount = np.random.lognormal(mean=15.0, sigma=2.0)  # ~3M RUB
-                amount = np.clip(amount, 100_000, 1_000_000_000)
-            elif asset_category == 'intangible':
-                amount = np.random.lognormal(mean=13.0, sigma=1.5)  # ~450k RUB
-                amount = np.clip(amount, 50_000, 100_000_000)
-            else:  # receivables, other
-                amount = np.random.lognormal(mean=14.0, sigma=2.0)  # ~1.2M RUB
-                amount = np.clip(amount, 10_000, 500_000_000)
-
-            # Валюта
-            is_monetary = asset_category in ['receivables', 'other']
-            currency = 'RUB' if not is_monetary or np.random.rand() < 0.90 else np.random.choice(['USD', 'EUR'])
-
-            if currency != 'RUB':
-                amount = amount / 85
-
-            # Maturity date только для receivables
-            if asset_category == 'receivables':
-                maturity_days = int(np.random.uniform(30, 365))
-                start_date = self.as_of_date - timedelta(days=int(np.random.uniform(0, maturity_days * 0.5)))
-                maturity_date = start_date + timedelta(days=maturity_days)
-            else:
-                start_date = self.as_of_date - timedelta(days=int(np.random.uniform(365, 3650)))
-                maturity_date = None
-
-            # Liquidation parameters
-            if asset_category == 'fixed_assets':
-                liquidity_haircut = np.random.uniform(0.40, 0.70)
-            else:
-                liquidity_haircut = np.random.uniform(0.10, 0.30) if is_monetary else 1.0
-
-            # Определяем торговый портфель
-            trading_portfolio = self._assign_trading_portfolio('other', None, False)
-
-            other_asset = {
-                'instrument_id': f'OTHER_ASSET_{i:08d}',
-                'instrument_type': 'other_asset',
-                'balance_account': np.random.choice(self.balance_accounts['other_asset']),
-                'amount': float(amount),
-                'currency': currency,
-                'start_date': start_date.isoformat(),
-                'maturity_date': maturity_date.isoformat() if maturity_date and maturity_date > self.as_of_date else None,
-                'interest_rate': None,
-                'counterparty_id': None,
-                'counterparty_type': None,
-                'as_of_date': self.as_of_date.isoformat(),
-                'asset_category': asset_category,
-                'is_monetary': is_monetary,
-                'liquidity_haircut': liquidity_haircut,
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            other_assets.append(other_asset)
-
-        return pd.DataFrame(other_assets)
+        rng = self._rngs['other_assets']
+
+        # Категория актива: fixed_assets, intangible, receivables, other
+        categories = np.array(['fixed_assets', 'intangible', 'receivables', 'other'], dtype=object)
+        category_idx = self._sample_codes(rng, [0.40, 0.20, 0.30, 0.10], count)
+        asset_category = categories[category_idx]
+        is_receivable = category_idx == 2
+        is_monetary = category_idx >= 2
+
+        # Сумма (fixed_assets ~3M, intangible ~450k, receivables/other ~1.2M RUB)
+        amount = self._truncated_lognormal(
+            rng,
+            mean=np.array([15.0, 13.0, 14.0, 14.0])[category_idx],
+            sigma=np.array([2.0, 1.5, 2.0, 2.0])[category_idx],
+            low=np.array([100_000, 50_000, 10_000, 10_000])[category_idx],
+            high=np.array([1_000_000_000, 100_000_000, 500_000_000, 500_000_000])[category_idx]
+        )
+
+        # Валюта: немонетарные активы - только RUB, монетарные - 10% в USD/EUR
+        is_foreign = is_monetary & (rng.random(count) >= 0.90)
+        currency_idx = np.where(is_foreign, rng.choice(2, size=count) + 1, 0)
+        currency = self._categorical(['RUB', 'USD', 'EUR'], currency_idx)
+        amount = amount / FX_DIVISORS[currency_idx]
+
+        # Maturity date только для receivables
+        maturity_days = rng.uniform(30, 365, size=count).astype(np.int64)
+        start_offset = -np.where(
+            is_receivable,
+            rng.uniform(0, maturity_days * 0.5),
+            rng.uniform(365, 3650, size=count)
+        ).astype(np.int64)
+        maturity_offset = start_offset + maturity_days
+
+        # Liquidation parameters
+        liquidity_haircut = np.where(
+            category_idx == 0,
+            rng.uniform(0.40, 0.70, size=count),
+            np.where(is_monetary, rng.uniform(0.10, 0.30, size=count), 1.0)
+        )
+
+        # Определяем торговый портфель
+        trading_portfolio = self._assign_trading_portfolios(rng, 'other', count)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('OTHER_ASSET_', np.arange(count), 8),
+            'instrument_type': 'other_asset',
+            'balance_account': self._choice_categorical(rng, BALANCE_ACCOUNTS['other_asset'], count),
+            'amount': amount,
+            'currency': currency,
+            'start_date': self._iso_dates(start_offset),
+            'maturity_date': self._iso_dates(maturity_offset, is_receivable & (maturity_offset > 0)),
+            'interest_rate': None,
+            'counterparty_id': None,
+            'counterparty_type': None,
+            'as_of_date': self._as_of_iso,
+            'asset_category': asset_category,
+            'is_monetary': is_monetary,
+            'liquidity_haircut': liquidity_haircut,
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
 
     def _generate_other_liabilities(self, count: int) -> pd.DataFrame:
         """Генерирует прочие пассивы"""
         logger.info(f"Generating {count} other liabilities")
-
-        other_liabilities = []
-        for i in range(count):
-            # Категория пассива
-            liability_category = np.random.choice(
-                ['payables', 'reserves', 'payroll', 'other'],
-                p=[0.40, 0.30, 0.20, 0.10]
-            )
-
-            # Сумма
-            if liability_category == 'reserves':
-                amount = np.random.lognormal(mean=15.5, sigma=2.0)  # ~5M RUB
-                amount = np.clip(amount, 500_000, 2_000_000_000)
-            elif liability_category == 'payroll':
-                amount = np.random.lognormal(mean=13.5, sigma=1.5)  # ~650k RUB
-                amount = np.clip(amount, 50_000, 50_000_000)
-            else:  # payables, other
-                amount = np.random.lognormal(mean=14.5, sigma=2.0)  # ~2M RUB
-                amount = np.clip(amount, 10_000, 500_000_000)
-
-            # Валюта
-            is_monetary = liability_category in ['payables', 'payroll', 'other']
-            currency = 'RUB' if not is_monetary or np.random.rand() < 0.95 else 'USD'
-
-            if currency != 'RUB':
-                amount = amount / 85
-
-            # Maturity date
-            if liability_category == 'payables':
-                maturity_days = int(np.random.uniform(15, 90))
-            elif liability_category == 'payroll':
-                maturity_days = int(np.random.uniform(1, 30))
-            else:  # reserves, other
-                maturity_days = int(np.random.uniform(180, 730))
-
-            start_date = self.as_of_date - timedelta(days=int(np.random.uniform(0, maturity_days * 0.3)))
-            maturity_date = start_date + timedelta(days=maturity_days)
-
-            # Определяем торговый портфель
-            trading_portfolio = self._assign_trading_portfolio('other', None, False)
-
-            other_liability = {
-                'instrument_id': f'OTHER_LIAB_{i:08d}',
-                'instrument_type': 'other_liability',
-                'balance_account': np.random.choice(self.balance_accounts['other_liability']),
-                'amount': float(amount),
-                'currency': currency,
-                'start_date': start_date.isoformat(),
-                'maturity_date': maturity_date.isoformat() if maturity_date > self.as_of_date else None,
-                'interest_rate': None,
-                'counterparty_id': None,
-                'counterparty_type': None,
-                'as_of_date': self.as_of_date.isoformat(),
-                'liability_category': liability_category,
-                'is_monetary': is_monetary,
-                'priority_level': np.random.choice(['senior', 'subordinated'], p=[0.90, 0.10]),
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            other_liabilities.append(other_liability)
-
-        return pd.DataFrame(other_liabilities)
+        rng = self._rngs['other_liabilities']
+
+        # Категория пассива: payables, reserves, payroll, other
+        categories = np.array(['payables', 'reserves', 'payroll', 'other'], dtype=object)
+        category_idx = self._sample_codes(rng, [0.40, 0.30, 0.20, 0.10], count)
+        liability_category = categories[category_idx]
+        is_monetary = category_idx != 1
+
+        # Сумма (reserves ~5M, payroll ~650k, payables/other ~2M RUB)
+        amount = self._truncated_lognormal(
+            rng,
+            mean=np.array([14.5, 15.5, 13.5, 14.5])[category_idx],
+            sigma=np.array([2.0, 2.0, 1.5, 2.0])[category_idx],
+            low=np.array([10_000, 500_000, 50_000, 10_000])[category_idx],
+            high=np.array([500_000_000, 2_000_000_000, 50_000_000, 500_000_000])[category_idx]
+        )
+
+        # Валюта: монетарные пассивы - 5% в USD
+        is_foreign = is_monetary & (rng.random(count) >= 0.95)
+        currency_idx = is_foreign.astype(np.int8)
+        currency = self._categorical(['RUB', 'USD'], currency_idx)
+        amount = amount / FX_DIVISORS[currency_idx]
+
+        # Maturity date (payables 15-90 дней, payroll 1-30, reserves/other 180-730)
+        maturity_days = rng.uniform(
+            np.array([15, 180, 1, 180])[category_idx],
+            np.array([90, 730, 30, 730])[category_idx]
+        ).astype(np.int64)
+
+        start_offset = -rng.uniform(0, maturity_days * 0.3).astype(np.int64)
+        maturity_offset = start_offset + maturity_days
+
+        # Определяем торговый портфель
+        trading_portfolio = self._assign_trading_portfolios(rng, 'other', count)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('OTHER_LIAB_', np.arange(count), 8),
+            'instrument_type': 'other_liability',
+            'balance_account': self._choice_categorical(rng, BALANCE_ACCOUNTS['other_liability'], count),
+            'amount': amount,
+            'currency': currency,
+            'start_date': self._iso_dates(start_offset),
+            'maturity_date': self._iso_dates(maturity_offset, maturity_offset > 0),
+            'interest_rate': None,
+            'counterparty_id': None,
+            'counterparty_type': None,
+            'as_of_date': self._as_of_iso,
+            'liability_category': liability_category,
+            'is_monetary': is_monetary,
+            'priority_level': np.array(['senior', 'subordinated'], dtype=object)[
+                self._sample_codes(rng, [0.90, 0.10], count)
+            ],
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
 
     def _generate_off_balance(self, count: int) -> pd.DataFrame:
         """Генерирует внебалансовые инструменты"""
         logger.info(f"Generating {count} off-balance instruments")
+        rng = self._rngs['off_balance']
+
+        # Тип внебалансового инструмента: guarantee, credit_line, forward, swap
+        off_balance_types = np.array(['guarantee', 'credit_line', 'forward', 'swap'], dtype=object)
+        type_idx = self._sample_codes(rng, [0.40, 0.35, 0.15, 0.10], count)
+        off_balance_type = off_balance_types[type_idx]
+        is_commitment = type_idx <= 1  # Гарантии и кредитные линии
+        is_forward = type_idx == 2
+        is_swap = type_idx == 3
+
+        # Notional amount (обязательства ~13M, деривативы ~65M RUB)
+        notional = self._truncated_lognormal(
+            rng,
+            mean=np.where(is_commitment, 16.5, 18.0),
+            sigma=np.where(is_commitment, 2.0, 1.5),
+            low=np.where(is_commitment, 1_000_000, 10_000_000),
+            high=np.where(is_commitment, 5_000_000_000, 50_000_000_000)
+        )
+
+        # Валюта
+        leg_currencies = np.array(['RUB', 'USD', 'EUR'], dtype=object)
+        currency_idx = self._sample_codes(rng, [0.60, 0.25, 0.15], count)
+        currency = self._categorical(leg_currencies, currency_idx)
+        notional = notional / FX_DIVISORS[currency_idx]
+
+        # Даты: обязательства 3 мес - 3 года, деривативы 1 мес - 2 года
+        expiry_days = rng.uniform(
+            np.where(is_commitment, 90, 30), np.where(is_commitment, 1095, 730)
+        ).astype(np.int64)
+        draw_down_probability = np.where(
+            is_commitment, rng.uniform(0.20, 0.60, size=count), np.nan
+        )
+
+        # Специфичные параметры для деривативов: форвард меняет валюту платежа
+        # на любую из двух других, своп - в одной валюте
+        receive_idx = np.where(
+            is_forward, (currency_idx + rng.integers(1, 3, size=count)) % 3, currency_idx
+        )
+        pay_currency = np.where(is_commitment, None, leg_currencies[currency_idx])
+        receive_currency = np.where(is_commitment, None, leg_currencies[receive_idx])
+
+        # FX rate (simplified)
+        fx_rate = np.where((currency_idx == 1) | (receive_idx == 1), 85.0, 90.0)
+        pay_amount = np.where(is_forward, notional, np.nan)
+        receive_amount = np.where(
+            is_forward,
+            np.where(currency_idx != 0, notional * fx_rate, notional / fx_rate),
+            np.nan
+        )
+        is_payer = np.where(is_swap, rng.random(count) < 0.5, None)
+
+        # Utilized amount для гарантий и кредитных линий
+        utilized_amount = notional * rng.uniform(0.0, 0.50, size=count)
+        available_amount = notional - utilized_amount
+
+        # Определяем торговый портфель (деривативы часто в торговой книге)
+        is_short_term = expiry_days <= 180
+        trading_portfolio = self._assign_trading_portfolios(rng, 'derivative', count, is_short_term=is_short_term)
+
+        return self._to_frame({
+            'instrument_id': self._make_ids('OFF_BAL_', np.arange(count), 8),
+            'instrument_type': 'off_balance',
+            'balance_account': '99999',  # Внебалансовый счет
+            'amount': notional,
+            'currency': currency,
+            'start_date': self._iso_dates(-rng.uniform(0, 180, size=count).astype(np.int64)),
+            'maturity_date': None,
+            'interest_rate': np.where(is_swap, rng.uniform(0.05, 0.15, size=count), np.nan),
+            'counterparty_id': self._make_ids('CPTY_OFF_BAL_', np.arange(count) % 500, 4),
+            'counterparty_type': self._choice_categorical(
+                rng, ['corporate', 'bank', 'government'], count, p=[0.50, 0.40, 0.10]
+            ),
+            'as_of_date': self._as_of_iso,
+            'off_balance_type': off_balance_type,
+            'notional_amount': notional,
+            'draw_down_probability': draw_down_probability,
+            'expiry_date': self._iso_dates(expiry_days, expiry_days > 0),
+            'settlement_date': self._iso_dates(expiry_days, ~is_commitment & (expiry_days > 0)),
+            'derivative_type': np.select([is_forward, is_swap], ['FX_FORWARD', 'IRS'], None),
+            'pay_leg_currency': pay_currency,
+            'receive_leg_currency': receive_currency,
+            'pay_leg_amount': pay_amount,
+            'receive_leg_amount': receive_amount,
+            'is_payer': is_payer,
+            'utilized_amount': np.where(is_commitment, utilized_amount, np.nan),
+            'available_amount': np.where(is_commitment, available_amount, np.nan),
+            'trading_portfolio': trading_portfolio,
+            'data_source': 'mock_generator',
+            'version': '1.0',
+        })
+
+    @staticmethod
+    def to_arrow_table(datasets: Dict[str, pd.DataFrame]) -> Any:
+        """
+        Объединяет все datasets в одну таблицу Arrow (требует пакет pyarrow).
+
+        Общие колонки хранятся одним буфером на все инструменты; колонки,
+        специфичные для типа инструмента, у остальных строк пустые (null).
+        instrument_type - словарная колонка-дискриминатор (_to_frame хранит
+        строковые скаляры как pd.Categorical): строки одного типа выбираются
+        через pyarrow.compute (table.filter(pc.equal(...))).
 
-        off_balance = []
-        for i in range(count):
-            # Тип внебалансового инструмента
-            off_balance_type = np.random.choice(
-                ['guarantee', 'credit_line', 'forward', 'swap'],
-                p=[0.40, 0.35, 0.15, 0.10]
+        Args:
+            datasets: Dict с DataFrames для каждого типа инструмента
+
+        Returns:
+            pyarrow.Table со строками всех наборов данных в порядке datasets
+        """
+        import pyarrow as pa
+
+        # Пустые (None) низкокардинальные колонки тоже делаем словарными:
+        # иначе типы колонок в разных наборах не совпадают
+        tables = [
+            pa.Table.from_pandas(
+                df.astype({key: 'category' for key in CATEGORICAL_COLUMNS.intersection(df.columns)}),
+                preserve_index=False
             )
+            for df in datasets.values()
+        ]
+        return pa.concat_tables(tables, promote_options='permissive')
 
-            # Notional amount
-            if off_balance_type in ['guarantee', 'credit_line']:
-                notional = np.random.lognormal(mean=16.5, sigma=2.0)  # ~13M RUB
-                notional = np.clip(notional, 1_000_000, 5_000_000_000)
-            else:  # derivatives
-                notional = np.random.lognormal(mean=18.0, sigma=1.5)  # ~65M RUB
-                notional = np.clip(notional, 10_000_000, 50_000_000_000)
-
-            # Валюта
-            currency = np.random.choice(['RUB', 'USD', 'EUR'], p=[0.60, 0.25, 0.15])
-            if currency != 'RUB':
-                notional = notional / 85
-
-            # Даты
-            if off_balance_type in ['guarantee', 'credit_line']:
-                expiry_days = int(np.random.uniform(90, 1095))  # 3 мес - 3 года
-                settlement_date = None
-                draw_down_probability = np.random.uniform(0.20, 0.60)
-            else:  # derivatives
-                expiry_days = int(np.random.uniform(30, 730))  # 1 мес - 2 года
-                settlement_date = self.as_of_date + timedelta(days=expiry_days)
-                draw_down_probability = None
-
-            expiry_date = self.as_of_date + timedelta(days=expiry_days)
-
-            # Специфичные параметры для деривативов
-            if off_balance_type == 'forward':
-                derivative_type = 'FX_FORWARD'
-                pay_currency = currency
-                receive_currency = np.random.choice(['RUB', 'USD', 'EUR'])
-                while receive_currency == pay_currency:
-                    receive_currency = np.random.choice(['RUB', 'USD', 'EUR'])
-
-                # FX rate (simplified)
-                fx_rate = 85.0 if 'USD' in [pay_currency, receive_currency] else 90.0
-                pay_amount = notional
-                receive_amount = notional * fx_rate if pay_currency != 'RUB' else notional / fx_rate
-            elif off_balance_type == 'swap':
-                derivative_type = 'IRS'
-                is_payer = np.random.rand() < 0.5
-                pay_currency = currency
-                receive_currency = currency
-                pay_amount = None
-                receive_amount = None
-            else:
-                derivative_type = None
-                pay_currency = None
-                receive_currency = None
-                pay_amount = None
-                receive_amount = None
-
-            # Utilized amount для гарантий и кредитных линий
-            if off_balance_type in ['guarantee', 'credit_line']:
-                utilized_pct = np.random.uniform(0.0, 0.50)
-                utilized_amount = notional * utilized_pct
-                available_amount = notional - utilized_amount
-            else:
-                utilized_amount = None
-                available_amount = None
-
-            # Определяем торговый портфель (деривативы часто в торговой книге)
-            is_short_term = expiry_days <= 180
-            trading_portfolio = self._assign_trading_portfolio('derivative', None, is_short_term)
-
-            off_bal = {
-                'instrument_id': f'OFF_BAL_{i:08d}',
-                'instrument_type': 'off_balance',
-                'balance_account': '99999',  # Внебалансовый счет
-                'amount': float(notional),
-                'currency': currency,
-                'start_date': (self.as_of_date - timedelta(days=int(np.random.uniform(0, 180)))).isoformat(),
-                'maturity_date': None,
-                'interest_rate': np.random.uniform(0.05, 0.15) if off_balance_type == 'swap' else None,
-                'counterparty_id': f'CPTY_OFF_BAL_{i % 500:04d}',
-                'counterparty_type': np.random.choice(['corporate', 'bank', 'government'], p=[0.50, 0.40, 0.10]),
-                'as_of_date': self.as_of_date.isoformat(),
-                'off_balance_type': off_balance_type,
-                'notional_amount': float(notional),
-                'draw_down_probability': draw_down_probability,
-                'expiry_date': expiry_date.isoformat() if expiry_date > self.as_of_date else None,
-                'settlement_date': settlement_date.isoformat() if settlement_date and settlement_date > self.as_of_date else None,
-                'derivative_type': derivative_type,
-                'pay_leg_currency': pay_currency,
-                'receive_leg_currency': receive_currency,
-                'pay_leg_amount': float(pay_amount) if pay_amount else None,
-                'receive_leg_amount': float(receive_amount) if receive_amount else None,
-                'is_payer': is_payer if off_balance_type == 'swap' else None,
-                'utilized_amount': float(utilized_amount) if utilized_amount else None,
-                'available_amount': float(available_amount) if available_amount else None,
-                'trading_portfolio': trading_portfolio,
-                'data_source': 'mock_generator',
-                'version': '1.0',
-            }
-
-            off_balance.append(off_bal)
-
-        return pd.DataFrame(off_balance)
+    def save_datasets(self, datasets: Dict[str, pd.DataFrame]) -> None:
+        """
+        Сохраняет все datasets в формате output_format.
+
+        Args:
+            datasets: Dict с DataFrames для каждого типа инструмента
+        """
+        if self.output_format == 'parquet':
+            self.save_to_parquet(datasets)
+        else:
+            self.save_to_csv(datasets)
 
     def save_to_csv(self, datasets: Dict[str, pd.DataFrame]) -> None:
         """
@@ -1004,7 +1298,34 @@ class MockDataGenerator:
 
         for instrument_type, df in datasets.items():
             output_path = self.output_dir / f"{instrument_type}.csv"
-            df.to_csv(output_path, index=False, encoding='utf-8')
+            # Запись блоками: форматированный текст не собирается для всего файла сразу
+            df.to_csv(output_path, index=False, encoding='utf-8', chunksize=WRITE_CHUNK_SIZE)
+            logger.info(f"Saved {len(df)} {instrument_type} to {output_path}")
+
+        # Сводная статистика
+        self._generate_summary(datasets)
+
+    def save_to_parquet(self, datasets: Dict[str, pd.DataFrame]) -> None:
+        """
+        Сохраняет все datasets в файлы Parquet (сжатие zstd).
+
+        Колонки пишутся в бинарном виде без форматирования строк;
+        pd.Categorical сохраняются как словарные колонки Arrow.
+
+        Args:
+            datasets: Dict с DataFrames для каждого типа инструмента
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        logger.info(f"Saving datasets to {self.output_dir}")
+
+        for instrument_type, df in datasets.items():
+            output_path = self.output_dir / f"{instrument_type}.parquet"
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(
+                table, output_path, compression='zstd', row_group_size=WRITE_CHUNK_SIZE
+            )
             logger.info(f"Saved {len(df)} {instrument_type} to {output_path}")
 
         # Сводная статистика
@@ -1022,26 +1343,21 @@ class MockDataGenerator:
             count = len(df)
             total_positions += count
 
+            # Один массив сумм на набор: итоги и разбиение по знаку без копий столбца
+            amounts = df['amount'].to_numpy()
+            total_amount = amounts.sum()
+
             # Определяем знак (актив/пассив) для каждого типа
             if instrument_type in ['loans', 'reverse_repo', 'other_assets']:
-                total_assets += df['amount'].sum()
+                total_assets += total_amount
                 sign = 'Asset'
             elif instrument_type in ['deposits', 'repo', 'current_accounts', 'other_liabilities']:
-                total_liabilities += df['amount'].sum()
+                total_liabilities += total_amount
                 sign = 'Liability'
-            elif instrument_type == 'interbank':
-                # МБК может быть активом или пассивом
-                assets_sum = df[df['amount'] > 0]['amount'].sum()
-                liabilities_sum = abs(df[df['amount'] < 0]['amount'].sum())
-                total_assets += assets_sum
-                total_liabilities += liabilities_sum
-                sign = 'Mixed'
-            elif instrument_type == 'correspondent_accounts':
-                # Корсчета тоже могут быть активами или пассивами
-                assets_sum = df[df['amount'] > 0]['amount'].sum()
-                liabilities_sum = abs(df[df['amount'] < 0]['amount'].sum())
-                total_assets += assets_sum
-                total_liabilities += liabilities_sum
+            elif instrument_type in ['interbank', 'correspondent_accounts']:
+                # МБК и корсчета могут быть активами или пассивами
+                total_assets += np.where(amounts > 0, amounts, 0.0).sum()
+                total_liabilities += np.where(amounts < 0, -amounts, 0.0).sum()
                 sign = 'Mixed'
             else:
                 sign = 'Off-Balance'
@@ -1049,8 +1365,8 @@ class MockDataGenerator:
             summary.append({
                 'instrument_type': instrument_type,
                 'count': count,
-                'total_amount': df['amount'].sum(),
-                'avg_amount': df['amount'].mean(),
+                'total_amount': total_amount,
+                'avg_amount': total_amount / count if count else np.nan,
                 'sign': sign
             })
 
@@ -1058,15 +1374,17 @@ class MockDataGenerator:
         summary_path = self.output_dir / 'summary_statistics.csv'
         summary_df.to_csv(summary_path, index=False)
 
-        logger.info(f"\n{'='*60}")
-        logger.info("SUMMARY STATISTICS")
-        logger.info(f"{'='*60}")
-        logger.info(f"Total positions generated: {total_positions:,}")
-        logger.info(f"Total Assets (approx): {total_assets:,.2f}")
-        logger.info(f"Total Liabilities (approx): {total_liabilities:,.2f}")
-        logger.info(f"Net Position: {total_assets - total_liabilities:,.2f}")
-        logger.info(f"{'='*60}\n")
-        logger.info(summary_df.to_string())
+        # Сводка печатается только при включенном INFO: to_string форматирует всю таблицу
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"\n{'='*60}")
+            logger.info("SUMMARY STATISTICS")
+            logger.info(f"{'='*60}")
+            logger.info(f"Total positions generated: {total_positions:,}")
+            logger.info(f"Total Assets (approx): {total_assets:,.2f}")
+            logger.info(f"Total Liabilities (approx): {total_liabilities:,.2f}")
+            logger.info(f"Net Position: {total_assets - total_liabilities:,.2f}")
+            logger.info(f"{'='*60}\n")
+            logger.info(summary_df.to_string())
         logger.info(f"\nSummary saved to {summary_path}")
 
 
@@ -1103,8 +1421,8 @@ def main():
     # Generate all instruments
     datasets = generator.generate_all_instruments(total_positions=total_positions)
 
-    # Save to CSV
-    generator.save_to_csv(datasets)
+    # Save datasets (CSV by default)
+    generator.save_datasets(datasets)
 
     logger.info("\nMock data generation completed successfully!")
 
@@ -7,14 +7,103 @@ Applies stress scenarios to balance sheet positions and calculates risk metrics.
 import pandas as pd
 import numpy as np
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Optional, Sequence, Tuple
 from datetime import date, timedelta
 from dataclasses import dataclass, field
 
-from alm_calculator.core.base_instrument import BaseInstrument, RiskContribution
+from alm_calculator.core.base_instrument import BaseInstrument, InstrumentType, RiskContribution
 
 logger = logging.getLogger(__name__)
 
+# IRR бакеты: бакет i содержит сроки до переоценки (_IRR_BUCKET_LIMITS[i-1],
+# _IRR_BUCKET_LIMITS[i]] дней, последний - все, что дальше 10 лет
+_IRR_BUCKETS = np.array([
+    '0-1m', '1-3m', '3-6m', '6-12m', '1-2y', '2-3y', '3-5y', '5-7y', '7-10y', '10y+'
+], dtype=object)
+_IRR_BUCKET_LIMITS = np.array([30, 90, 180, 365, 730, 1095, 1825, 2555, 3650])
+
+
+def _gap_table(
+    currencies: Sequence[str],
+    buckets: Sequence[str],
+    amounts: Sequence[float],
+    value_column: str
+) -> pd.DataFrame:
+    """
+    Суммирует amounts по парам (валюта, бакет).
+
+    Суммы считаются через np.bincount: слагаемые накапливаются в порядке
+    входа, как при сложении в словаре. Строки идут по валютам в порядке
+    первого появления, внутри валюты - бакеты в порядке первого появления.
+
+    Returns:
+        DataFrame с колонками currency, bucket, value_column
+    """
+    currency_codes, currency_labels = pd.factorize(np.array(currencies, dtype=object))
+    bucket_codes, bucket_labels = pd.factorize(np.array(buckets, dtype=object))
+    bucket_count = len(bucket_labels)
+
+    pair_codes, pairs = pd.factorize(currency_codes * bucket_count + bucket_codes)
+    sums = np.bincount(
+        pair_codes, weights=np.asarray(amounts, dtype=float), minlength=len(pairs)
+    )
+    order = np.argsort(pairs // bucket_count, kind='stable')
+    pairs = pairs[order]
+
+    return pd.DataFrame({
+        'currency': np.asarray(currency_labels, dtype=object)[pairs // bucket_count],
+        'bucket': np.asarray(bucket_labels, dtype=object)[pairs % bucket_count],
+        value_column: sums[order]
+    })
+
+
+# Число блоков инструментов на процесс при параллельном расчете вкладов:
+# несколько блоков на процесс выравнивают нагрузку между типами инструментов
+CONTRIBUTION_CHUNKS_PER_WORKER = 4
+
+
+def _calculate_contributions_chunk(
+    instruments: List[BaseInstrument],
+    calculation_date: date,
+    risk_params: Dict,
+    assumptions: Optional[Dict]
+) -> List[Optional[RiskContribution]]:
+    """
+    Рассчитывает risk contribution для блока инструментов.
+
+    Функция уровня модуля: вызывается и в текущем процессе, и в процессах
+    ProcessPoolExecutor (передается без калькулятора и всего портфеля).
+    Результат выровнен по instruments: для инструментов, расчет которых
+    завершился ошибкой, - None.
+    """
+    risk_contributions = []
+
+    for instrument in instruments:
+        try:
+            # Get instrument-specific assumptions if provided
+            inst_assumptions = assumptions.get(instrument.instrument_type.value, {}) if assumptions else {}
+
+            # Calculate contribution
+            contribution = instrument.calculate_risk_contribution(
+                calculation_date=calculation_date,
+                risk_params=risk_params,
+                assumptions=inst_assumptions
+            )
+
+            risk_contributions.append(contribution)
+
+        except Exception as e:
+            logger.error(
+                f"Failed to calculate risk contribution for instrument {instrument.instrument_id}: {e}",
+                exc_info=True
+            )
+            # Continue with other instruments
+            risk_contributions.append(None)
+
+    return risk_contributions
+
 
 @dataclass
 class ScenarioParameters:
@@ -126,15 +215,24 @@ class ScenarioCalculator:
     def __init__(
         self,
         instruments: List[BaseInstrument],
-        risk_params: Optional[Dict] = None
+        risk_params: Optional[Dict] = None,
+        max_workers: Optional[int] = None
     ):
         """
         Args:
             instruments: Список всех инструментов портфеля
             risk_params: Параметры для расчета рисков (buckets, curves, etc.)
+            max_workers: Число процессов для параллельного расчета risk
+                         contributions и сценариев в compare_scenarios
+                         (None или 1 - последовательно)
         """
         self.instruments = instruments
         self.risk_params = risk_params or self._default_risk_params()
+        self.max_workers = max_workers
+
+        # Кэш вкладов инструментов, не затронутых стрессом, на время
+        # compare_scenarios: {(дата расчета, assumptions): {id(инструмента): вклад}}
+        self._contribution_cache: Optional[Dict[Tuple[date, str], Dict[int, RiskContribution]]] = None
 
         logger.info(f"Initialized ScenarioCalculator with {len(instruments)} instruments")
 
@@ -189,6 +287,40 @@ class ScenarioCalculator:
 
         return result
 
+    @staticmethod
+    def _portfolio_arrays(instruments: List[BaseInstrument]) -> Dict[str, np.ndarray]:
+        """
+        Колонки портфеля, затрагиваемые стрессом, в виде массивов NumPy.
+
+        Строка массива соответствует инструменту с тем же индексом в instruments.
+        Отсутствующие ставки - NaN (маска has_rate), отсутствующие суммы
+        внебалансовых линий - 0.0.
+        """
+        count = len(instruments)
+
+        def column(getter, dtype=float) -> np.ndarray:
+            return np.fromiter(map(getter, instruments), dtype=dtype, count=count)
+
+        def off_balance_amount(key: str):
+            # Поля кредитных линий есть только у внебалансовых инструментов:
+            # у остальных отсутствующий атрибут pydantic-модели не запрашивается
+            return lambda inst: (
+                getattr(inst, key, None) or 0.0
+                if inst.instrument_type is InstrumentType.OFF_BALANCE else 0.0
+            )
+
+        return {
+            'amount': column(lambda inst: inst.amount),
+            'interest_rate': column(
+                lambda inst: np.nan if inst.interest_rate is None else inst.interest_rate
+            ),
+            'has_rate': column(lambda inst: inst.interest_rate is not None, bool),
+            'currency': column(lambda inst: inst.currency, object),
+            'instrument_type': column(lambda inst: inst.instrument_type.value, object),
+            'available_amount': column(off_balance_amount('available_amount')),
+            'utilized_amount': column(off_balance_amount('utilized_amount')),
+        }
+
     def _apply_scenario_stress(
         self,
         instruments: List[BaseInstrument],
@@ -203,45 +335,75 @@ class ScenarioCalculator:
         - Применяет runoff к депозитам
         - И т.д.
 
-        Важно: возвращает копии инструментов, не модифицируя оригиналы.
+        Шоки считаются векторно по колонкам портфеля (_portfolio_arrays).
+        Важно: оригиналы не модифицируются - затронутые стрессом инструменты
+        заменяются копиями с новыми значениями (model_copy(update=...)),
+        остальные возвращаются как есть.
         """
         logger.debug(f"Applying stress scenario: {scenario.scenario_name}")
 
-        stressed_instruments = []
-
-        for instrument in instruments:
-            # Copy instrument (shallow copy достаточно для большинства случаев)
-            stressed_inst = instrument.model_copy(deep=True)
-
-            # Apply interest rate shock
-            if scenario.interest_rate_shock_bps:
-                currency = stressed_inst.currency
-                if currency in scenario.interest_rate_shock_bps:
-                    shock_bps = scenario.interest_rate_shock_bps[currency]
-                    if stressed_inst.interest_rate is not None:
-                        stressed_inst.interest_rate += shock_bps / 10000  # Convert bps to decimal
-
-            # Deposit runoff (уменьшаем amount)
-            if scenario.deposit_runoff_pct > 0:
-                if stressed_inst.instrument_type.value == 'deposit':
-                    runoff_multiplier = 1 - (scenario.deposit_runoff_pct / 100)
-                    stressed_inst.amount = stressed_inst.amount * runoff_multiplier
-
-            # Credit line drawdown (увеличиваем utilized для off-balance)
-            if scenario.credit_line_drawdown_pct > 0:
-                if stressed_inst.instrument_type.value == 'off_balance':
-                    if hasattr(stressed_inst, 'available_amount') and stressed_inst.available_amount:
-                        drawdown = stressed_inst.available_amount * (scenario.credit_line_drawdown_pct / 100)
-                        if hasattr(stressed_inst, 'utilized_amount'):
-                            if stressed_inst.utilized_amount:
-                                stressed_inst.utilized_amount += drawdown
-                            else:
-                                stressed_inst.utilized_amount = drawdown
-                        stressed_inst.available_amount -= drawdown
-
-            stressed_instruments.append(stressed_inst)
-
-        logger.debug(f"Applied stress to {len(stressed_instruments)} instruments")
+        if not (
+            scenario.interest_rate_shock_bps
+            or scenario.deposit_runoff_pct > 0
+            or scenario.credit_line_drawdown_pct > 0
+        ):
+            # Сценарий не меняет атрибуты инструментов (baseline, FX/haircut шоки):
+            # колонки портфеля не извлекаются, инструменты возвращаются как есть
+            return list(instruments)
+
+        arrays = self._portfolio_arrays(instruments)
+        instrument_types = arrays['instrument_type']
+
+        # Поле -> (маска затронутых строк, новые значения)
+        updates: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        # Apply interest rate shock
+        if scenario.interest_rate_shock_bps:
+            currencies, currency_codes = np.unique(
+                arrays['currency'].astype(str), return_inverse=True
+            )
+            shocked = np.array(
+                [currency in scenario.interest_rate_shock_bps for currency in currencies], dtype=bool
+            )
+            shock = np.array(
+                [scenario.interest_rate_shock_bps.get(currency, 0.0) / 10000 for currency in currencies]
+            )  # Convert bps to decimal
+            mask = shocked[currency_codes] & arrays['has_rate']
+            updates['interest_rate'] = (mask, arrays['interest_rate'] + shock[currency_codes])
+
+        # Deposit runoff (уменьшаем amount)
+        if scenario.deposit_runoff_pct > 0:
+            runoff_multiplier = 1 - (scenario.deposit_runoff_pct / 100)
+            mask = instrument_types == 'deposit'
+            updates['amount'] = (mask, arrays['amount'] * runoff_multiplier)
+
+        # Credit line drawdown (увеличиваем utilized для off-balance)
+        if scenario.credit_line_drawdown_pct > 0:
+            available = arrays['available_amount']
+            mask = (instrument_types == 'off_balance') & (available != 0)
+            drawdown = available * (scenario.credit_line_drawdown_pct / 100)
+            updates['utilized_amount'] = (mask, arrays['utilized_amount'] + drawdown)
+            updates['available_amount'] = (mask, available - drawdown)
+
+        changed = np.zeros(len(instruments), dtype=bool)
+        for mask, _ in updates.values():
+            changed |= mask
+
+        values = {key: new_values.tolist() for key, (_, new_values) in updates.items()}
+        stressed_instruments = list(instruments)
+        for i in np.flatnonzero(changed).tolist():
+            instrument = instruments[i]
+            update = {
+                key: values[key][i]
+                for key, (mask, _) in updates.items()
+                if mask[i] and hasattr(instrument, key)
+            }
+            stressed_instruments[i] = instrument.model_copy(update=update)
+
+        logger.debug(
+            f"Applied stress to {len(stressed_instruments)} instruments "
+            f"({int(changed.sum())} changed)"
+        )
 
         return stressed_instruments
 
@@ -256,35 +418,97 @@ class ScenarioCalculator:
         """
         logger.debug(f"Calculating risk contributions for {len(instruments)} instruments")
 
-        risk_contributions = []
+        if self._contribution_cache is None:
+            risk_contributions = self._compute_risk_contributions(
+                instruments, calculation_date, assumptions
+            )
+        else:
+            # Исходные инструменты (не затронутые стрессом) живут все время
+            # сравнения сценариев, поэтому id однозначно их идентифицирует;
+            # копии, измененные стрессом, считаются заново
+            cache = self._contribution_cache.setdefault(
+                (calculation_date, repr(assumptions)), {}
+            )
+            originals = {id(instrument) for instrument in self.instruments}
+
+            risk_contributions = [cache.get(id(instrument)) for instrument in instruments]
+            pending = [i for i, contribution in enumerate(risk_contributions) if contribution is None]
+            computed = self._compute_risk_contributions(
+                [instruments[i] for i in pending], calculation_date, assumptions
+            )
+            for i, contribution in zip(pending, computed):
+                risk_contributions[i] = contribution
+                if contribution is not None and id(instruments[i]) in originals:
+                    cache[id(instruments[i])] = contribution
+
+            logger.debug(
+                f"Reused {len(instruments) - len(pending)} cached risk contributions"
+            )
+
+        risk_contributions = [
+            contribution for contribution in risk_contributions if contribution is not None
+        ]
 
-        for i, instrument in enumerate(instruments):
-            try:
-                # Get instrument-specific assumptions if provided
-                inst_assumptions = assumptions.get(instrument.instrument_type.value, {}) if assumptions else {}
-
-                # Calculate contribution
-                contribution = instrument.calculate_risk_contribution(
-                    calculation_date=calculation_date,
-                    risk_params=self.risk_params,
-                    assumptions=inst_assumptions
-                )
+        logger.debug(f"Successfully calculated {len(risk_contributions)} risk contributions")
+
+        return risk_contributions
 
-                risk_contributions.append(contribution)
+    def _compute_risk_contributions(
+        self,
+        instruments: List[BaseInstrument],
+        calculation_date: date,
+        assumptions: Optional[Dict]
+    ) -> List[Optional[RiskContribution]]:
+        """
+        Рассчитывает вклады инструментов (последовательно или в ProcessPoolExecutor).
 
-            except Exception as e:
-                logger.error(
-                    f"Failed to calculate risk contribution for instrument {instrument.instrument_id}: {e}",
-                    exc_info=True
+        Returns:
+            Вклады в порядке instruments (None для инструментов с ошибкой расчета)
+        """
+        parallel = self.max_workers is not None and self.max_workers > 1
+
+        # Прогресс для больших портфелей логируется каждые 50000 инструментов;
+        # при параллельном расчете блоки мельче, чтобы загрузить все процессы
+        chunk_size = 50000
+        if parallel:
+            chunk_size = min(chunk_size, max(
+                1, -(-len(instruments) // (self.max_workers * CONTRIBUTION_CHUNKS_PER_WORKER))
+            ))
+        chunks = [
+            instruments[start:start + chunk_size]
+            for start in range(0, len(instruments), chunk_size)
+        ]
+
+        if parallel and len(chunks) > 1:
+            # Инструменты независимы, а расчет упирается в GIL: блоки считаются
+            # в отдельных процессах, порядок вкладов сохраняется
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _calculate_contributions_chunk,
+                        chunk, calculation_date, self.risk_params, assumptions
+                    )
+                    for chunk in chunks
+                ]
+                chunk_results = [future.result() for future in futures]
+        else:
+            chunk_results = (
+                _calculate_contributions_chunk(
+                    chunk, calculation_date, self.risk_params, assumptions
                 )
-                # Continue with other instruments
-                continue
+                for chunk in chunks
+            )
 
-            # Progress logging for large portfolios
-            if (i + 1) % 50000 == 0:
-                logger.info(f"Processed {i + 1}/{len(instruments)} instruments")
+        risk_contributions = []
+        processed = 0
 
-        logger.debug(f"Successfully calculated {len(risk_contributions)} risk contributions")
+        for chunk, contributions in zip(chunks, chunk_results):
+            risk_contributions.extend(contributions)
+
+            # Progress logging for large portfolios
+            if (processed + len(chunk)) // 50000 > processed // 50000:
+                logger.info(f"Processed {processed + len(chunk)}/{len(instruments)} instruments")
+            processed += len(chunk)
 
         return risk_contributions
 
@@ -304,59 +528,36 @@ class ScenarioCalculator:
             risk_contributions=risk_contributions
         )
 
-        # === Liquidity Risk Aggregation ===
-        liquidity_gaps_by_currency = {}
-        for contrib in risk_contributions:
-            for bucket, amount in contrib.cash_flows.items():
-                currency = list(contrib.currency_exposure.keys())[0] if contrib.currency_exposure else 'RUB'
-
-                if currency not in liquidity_gaps_by_currency:
-                    liquidity_gaps_by_currency[currency] = {}
-
-                if bucket not in liquidity_gaps_by_currency[currency]:
-                    liquidity_gaps_by_currency[currency][bucket] = 0.0
-
-                liquidity_gaps_by_currency[currency][bucket] += amount
-
-        # Convert to DataFrame
-        if liquidity_gaps_by_currency:
-            liq_gaps_data = []
-            for currency, buckets in liquidity_gaps_by_currency.items():
-                for bucket, amount in buckets.items():
-                    liq_gaps_data.append({
-                        'currency': currency,
-                        'bucket': bucket,
-                        'gap': float(amount)
-                    })
-
-            result.liquidity_gaps = pd.DataFrame(liq_gaps_data)
-
-            # Calculate cumulative gaps
-            result.cumulative_gaps = self._calculate_cumulative_gaps(result.liquidity_gaps)
-
-            # Calculate survival horizon (simplified)
-            result.survival_horizon_days = self._calculate_survival_horizon(result.cumulative_gaps)
-
-        # === Interest Rate Risk Aggregation ===
-        irr_gaps_by_currency = {}
+        # Один проход по вкладам: значения собираются в плоские списки,
+        # суммирование по валютам и бакетам - векторное (_gap_table, bincount)
+        main_currencies = []
+        flow_counts = []
+        flow_buckets = []
+        flow_amounts = []
+        repricing_currencies = []
+        repricing_days = []
+        repricing_amounts = []
         duration_contributions = []
         dv01_contributions = []
+        exposure_currencies = []
+        exposure_amounts = []
 
         for contrib in risk_contributions:
-            # Repricing gaps
-            if contrib.repricing_date and contrib.repricing_amount:
-                currency = list(contrib.currency_exposure.keys())[0] if contrib.currency_exposure else 'RUB'
+            currency_exposure = contrib.currency_exposure
+            currency = next(iter(currency_exposure), 'RUB')
 
-                if currency not in irr_gaps_by_currency:
-                    irr_gaps_by_currency[currency] = {}
+            # Liquidity: денежные потоки по бакетам
+            cash_flows = contrib.cash_flows
+            main_currencies.append(currency)
+            flow_counts.append(len(cash_flows))
+            flow_buckets.extend(cash_flows)
+            flow_amounts.extend(cash_flows.values())
 
-                # Assign to IRR bucket
-                bucket = self._assign_to_irr_bucket(scenario.calculation_date, contrib.repricing_date)
-
-                if bucket not in irr_gaps_by_currency[currency]:
-                    irr_gaps_by_currency[currency][bucket] = 0.0
-
-                irr_gaps_by_currency[currency][bucket] += contrib.repricing_amount
+            # Repricing gaps
+            if contrib.repricing_date and contrib.repricing_amount:
+                repricing_currencies.append(currency)
+                repricing_days.append((contrib.repricing_date - scenario.calculation_date).days)
+                repricing_amounts.append(contrib.repricing_amount)
 
             # Duration & DV01
             if contrib.duration is not None:
@@ -365,19 +566,33 @@ class ScenarioCalculator:
             if contrib.dv01 is not None:
                 dv01_contributions.append(contrib.dv01)
 
-        # Convert to DataFrame
-        if irr_gaps_by_currency:
-            irr_gaps_data = []
-            for currency, buckets in irr_gaps_by_currency.items():
-                for bucket, amount in buckets.items():
-                    irr_gaps_data.append({
-                        'currency': currency,
-                        'bucket': bucket,
-                        'repricing_gap': float(amount)
-                    })
+            # FX positions
+            exposure_currencies.extend(currency_exposure)
+            exposure_amounts.extend(currency_exposure.values())
+
+        # === Liquidity Risk Aggregation ===
+        if flow_buckets:
+            # Валюта потока - основная валюта вклада
+            flow_currencies = np.repeat(np.array(main_currencies, dtype=object), flow_counts)
+            result.liquidity_gaps = _gap_table(flow_currencies, flow_buckets, flow_amounts, 'gap')
 
-            result.interest_rate_gaps = pd.DataFrame(irr_gaps_data)
-            result.repricing_gap_total = sum([row['repricing_gap'] for row in irr_gaps_data])
+            # Calculate cumulative gaps
+            result.cumulative_gaps = self._calculate_cumulative_gaps(result.liquidity_gaps)
+
+            # Calculate survival horizon (simplified)
+            result.survival_horizon_days = self._calculate_survival_horizon(result.cumulative_gaps)
+
+        # === Interest Rate Risk Aggregation ===
+        if repricing_amounts:
+            # Assign to IRR buckets (все сроки до переоценки разом)
+            buckets = _IRR_BUCKETS[np.searchsorted(_IRR_BUCKET_LIMITS, repricing_days)]
+
+            result.interest_rate_gaps = _gap_table(
+                repricing_currencies, buckets, repricing_amounts, 'repricing_gap'
+            )
+            result.repricing_gap_total = sum(
+                result.interest_rate_gaps['repricing_gap'].tolist()
+            )
 
         # Aggregate duration (weighted by amount - simplified)
         if duration_contributions:
@@ -388,12 +603,12 @@ class ScenarioCalculator:
             result.dv01_total = sum(dv01_contributions)
 
         # === FX Risk Aggregation ===
-        fx_positions = {}
-        for contrib in risk_contributions:
-            for currency, exposure in contrib.currency_exposure.items():
-                if currency not in fx_positions:
-                    fx_positions[currency] = 0.0
-                fx_positions[currency] += exposure
+        exposure_amounts = np.array(exposure_amounts, dtype=float)
+        currency_codes, currency_labels = pd.factorize(np.array(exposure_currencies, dtype=object))
+        fx_totals = np.bincount(
+            currency_codes, weights=exposure_amounts, minlength=len(currency_labels)
+        )
+        fx_positions = dict(zip(currency_labels.tolist(), fx_totals.tolist()))
 
         result.fx_positions = fx_positions
 
@@ -402,15 +617,11 @@ class ScenarioCalculator:
         result.fx_exposure_total = sum([abs(exp) for exp in fx_positions.values()])
 
         # === Summary Metrics ===
-        total_assets = 0.0
-        total_liabilities = 0.0
-
-        for contrib in risk_contributions:
-            for currency, exposure in contrib.currency_exposure.items():
-                if exposure > 0:
-                    total_assets += exposure
-                else:
-                    total_liabilities += abs(exposure)
+        # Суммы накапливаются последовательно (sum по спискам), как и раньше:
+        # попарное суммирование NumPy меняло бы младшие разряды итогов
+        is_asset = exposure_amounts > 0
+        total_assets = sum(exposure_amounts[is_asset].tolist(), 0.0)
+        total_liabilities = sum(np.abs(exposure_amounts[~is_asset]).tolist(), 0.0)
 
         result.total_assets = total_assets
         result.total_liabilities = total_liabilities
@@ -433,30 +644,22 @@ class ScenarioCalculator:
         bucket_order = ['overnight', '2-7d', '8-14d', '15-30d', '30-90d',
                         '90-180d', '180-365d', '1-2y', '2y+']
 
-        cumulative_data = []
-
-        for currency in liquidity_gaps['currency'].unique():
-            currency_gaps = liquidity_gaps[liquidity_gaps['currency'] == currency].copy()
-
-            cumulative_gap = 0.0
-            for bucket in bucket_order:
-                bucket_gaps = currency_gaps[currency_gaps['bucket'] == bucket]
-
-                if not bucket_gaps.empty:
-                    gap = bucket_gaps['gap'].sum()
-                else:
-                    gap = 0.0
-
-                cumulative_gap += gap
-
-                cumulative_data.append({
-                    'currency': currency,
-                    'bucket': bucket,
-                    'gap': gap,
-                    'cumulative_gap': cumulative_gap
-                })
+        # Гэпы в таблице валюта x бакет (валюты - в порядке появления, отсутствующие
+        # бакеты - нулевые), кумулятивный гэп - накопленная сумма по строке
+        currencies = liquidity_gaps['currency'].unique()
+        gaps = (
+            liquidity_gaps.groupby(['currency', 'bucket'])['gap'].sum()
+            .unstack('bucket', fill_value=0.0)
+            .reindex(index=currencies, columns=bucket_order, fill_value=0.0)
+            .to_numpy(dtype=float)
+        )
 
-        return pd.DataFrame(cumulative_data)
+        return pd.DataFrame({
+            'currency': np.repeat(np.asarray(currencies, dtype=object), len(bucket_order)),
+            'bucket': np.tile(np.array(bucket_order, dtype=object), len(currencies)),
+            'gap': gaps.ravel(),
+            'cumulative_gap': gaps.cumsum(axis=1).ravel()
+        })
 
     def _calculate_survival_horizon(self, cumulative_gaps: pd.DataFrame) -> Dict[str, int]:
         """
@@ -499,27 +702,7 @@ class ScenarioCalculator:
     def _assign_to_irr_bucket(self, calculation_date: date, repricing_date: date) -> str:
         """Assigns repricing date to IRR bucket"""
         days_to_repricing = (repricing_date - calculation_date).days
-
-        if days_to_repricing <= 30:
-            return '0-1m'
-        elif days_to_repricing <= 90:
-            return '1-3m'
-        elif days_to_repricing <= 180:
-            return '3-6m'
-        elif days_to_repricing <= 365:
-            return '6-12m'
-        elif days_to_repricing <= 730:
-            return '1-2y'
-        elif days_to_repricing <= 1095:
-            return '2-3y'
-        elif days_to_repricing <= 1825:
-            return '3-5y'
-        elif days_to_repricing <= 2555:
-            return '5-7y'
-        elif days_to_repricing <= 3650:
-            return '7-10y'
-        else:
-            return '10y+'
+        return str(_IRR_BUCKETS[np.searchsorted(_IRR_BUCKET_LIMITS, days_to_repricing)])
 
     def compare_scenarios(
         self,
@@ -538,17 +721,53 @@ class ScenarioCalculator:
         """
         logger.info(f"Comparing {len(scenarios)} scenarios")
 
-        results = []
-
-        for scenario in scenarios:
-            result = self.calculate_scenario(scenario, assumptions)
-            results.append(result.to_dict())
+        if self.max_workers is not None and self.max_workers > 1 and len(scenarios) > 1:
+            # Сценарии независимы: каждый процесс получает портфель один раз
+            # (initializer), а обратно передаются только сводки to_dict()
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(scenarios)),
+                initializer=_init_scenario_worker,
+                initargs=(self.instruments, self.risk_params)
+            ) as executor:
+                results = list(executor.map(
+                    _calculate_scenario_summary, scenarios, repeat(assumptions)
+                ))
+        else:
+            # Вклады инструментов, не затронутых стрессом, одинаковы во всех
+            # сценариях с той же датой расчета: считаются один раз
+            self._contribution_cache = {}
+            try:
+                results = [
+                    self.calculate_scenario(scenario, assumptions).to_dict()
+                    for scenario in scenarios
+                ]
+            finally:
+                self._contribution_cache = None
 
         comparison_df = pd.DataFrame(results)
 
         return comparison_df
 
 
+# Калькулятор процесса-воркера compare_scenarios (создается в _init_scenario_worker)
+_worker_calculator: Optional[ScenarioCalculator] = None
+
+
+def _init_scenario_worker(instruments: List[BaseInstrument], risk_params: Dict) -> None:
+    """Создает калькулятор процесса-воркера для расчета сценариев"""
+    global _worker_calculator
+    # Внутри воркера вклады считаются последовательно: параллельны сами сценарии
+    _worker_calculator = ScenarioCalculator(instruments, risk_params)
+
+
+def _calculate_scenario_summary(
+    scenario: ScenarioParameters,
+    assumptions: Optional[Dict]
+) -> Dict:
+    """Рассчитывает сценарий в процессе-воркере и возвращает ScenarioResult.to_dict()"""
+    return _worker_calculator.calculate_scenario(scenario, assumptions).to_dict()
+
+
 def create_baseline_scenario(calculation_date: date) -> ScenarioParameters:
     """Создает baseline сценарий (без стресса)"""
     return ScenarioParameters(
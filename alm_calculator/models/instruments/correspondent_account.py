@@ -2,7 +2,7 @@
 Correspondent Account instrument implementation
 Корреспондентские счета (НОСТРО и ЛОРО)
 """
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 from datetime import date, timedelta
 
 import logging
@@ -43,8 +43,7 @@ class CorrespondentAccount(BaseInstrument):
     # По умолчанию контрагент - банк или ЦБ
     counterparty_type: str = 'bank'
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    def model_post_init(self, __context: Any) -> None:
         # Устанавливаем counterparty_type в зависимости от account_type
         if self.account_type in ['cbr_required_reserve', 'cbr_operational']:
             self.counterparty_type = 'central_bank'
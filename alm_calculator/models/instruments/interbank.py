@@ -2,7 +2,7 @@
 Interbank loan instrument implementation
 Межбанковские кредиты (МБК)
 """
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 from datetime import date
 
 import logging
@@ -56,8 +56,7 @@ class InterbankLoan(BaseInstrument):
     # Портфельная принадлежность
     trading_portfolio: Optional[str] = None  # Торговый портфель
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    def model_post_init(self, __context: Any) -> None:
         # Автоматически определяем направление по знаку amount
         if self.is_placement is None:
             self.is_placement = self.amount > 0
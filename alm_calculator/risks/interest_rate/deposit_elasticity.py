@@ -5,10 +5,11 @@ Deposit Elasticity Model for Interest Rate Risk
 Моделирует изменение объемов депозитов в ответ на изменение процентных ставок.
 Используется для построения динамического баланса в рамках процентного риска.
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 from datetime import date
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 import logging
@@ -37,11 +38,23 @@ class DepositType(str, Enum):
     LONG_TERM = "long_term"  # Свыше года
 
 
-@dataclass
+# Порядковые номера значений enum для упакованного ключа
+# segment_idx * _N_DEPOSIT_TYPES + deposit_type_idx
+_SEGMENT_INDEX = {segment: i for i, segment in enumerate(CustomerSegment)}
+_DEPOSIT_TYPE_INDEX = {deposit_type: i for i, deposit_type in enumerate(DepositType)}
+_N_DEPOSIT_TYPES = len(DepositType)
+
+
+@dataclass(frozen=True)
 class ElasticityParameters:
     """
     Параметры эластичности для конкретного сегмента депозитов.
 
+    Неизменяемый объект: один экземпляр безопасно разделяется между
+    несколькими конфигурациями и калькуляторами. Фабрики create_*_default
+    кэшируют результат, поэтому конфигурации, использующие дефолтные
+    параметры, ссылаются на одни и те же экземпляры.
+
     Эластичность показывает процентное изменение объема депозитов
     при изменении ставки на 1 процентный пункт.
 
@@ -85,6 +98,7 @@ class ElasticityParameters:
     min_remaining_volume: Optional[float] = None  # Минимальный остаток (доля от исходного)
 
     @classmethod
+    @lru_cache(maxsize=None)
     def create_retail_demand_default(cls) -> 'ElasticityParameters':
         """Дефолтные параметры для депозитов ФЛ до востребования"""
         return cls(
@@ -101,6 +115,7 @@ class ElasticityParameters:
         )
 
     @classmethod
+    @lru_cache(maxsize=None)
     def create_retail_term_default(cls, deposit_type: DepositType = DepositType.SHORT_TERM) -> 'ElasticityParameters':
         """Дефолтные параметры для срочных депозитов ФЛ"""
         return cls(
@@ -120,6 +135,7 @@ class ElasticityParameters:
         )
 
     @classmethod
+    @lru_cache(maxsize=None)
     def create_corporate_default(cls, deposit_type: DepositType = DepositType.SHORT_TERM) -> 'ElasticityParameters':
         """Дефолтные параметры для депозитов юридических лиц"""
         return cls(
@@ -161,7 +177,7 @@ class DepositElasticityCalculator:
     def __init__(
         self,
         calculation_date: date,
-        elasticity_params: Dict[Tuple[CustomerSegment, DepositType], ElasticityParameters]
+        elasticity_params: Mapping[Tuple[CustomerSegment, DepositType], ElasticityParameters]
     ):
         """
         Args:
@@ -171,6 +187,26 @@ class DepositElasticityCalculator:
         self.calculation_date = calculation_date
         self.elasticity_params = elasticity_params
 
+    @staticmethod
+    def _build_params_table(
+        elasticity_params: Mapping[Tuple[CustomerSegment, DepositType], ElasticityParameters]
+    ) -> List[Optional[ElasticityParameters]]:
+        """
+        Строит плоскую таблицу параметров по упакованному ключу
+        (segment_idx * _N_DEPOSIT_TYPES + deposit_type_idx).
+
+        Откат на параметры (segment, DEMAND) для отсутствующих типов
+        депозитов разрешается один раз здесь, а не при каждом поиске.
+        Таблица строится заново при каждом расчете, поэтому замена или
+        изменение elasticity_params учитываются сразу.
+        """
+        table: List[Optional[ElasticityParameters]] = []
+        for segment in CustomerSegment:
+            fallback = elasticity_params.get((segment, DepositType.DEMAND))
+            for deposit_type in DepositType:
+                table.append(elasticity_params.get((segment, deposit_type), fallback))
+        return table
+
     def calculate_volume_changes(
         self,
         deposits: List[Deposit],
@@ -199,6 +235,7 @@ class DepositElasticityCalculator:
         )
 
         volume_changes = []
+        params_table = self._build_params_table(self.elasticity_params)
 
         for deposit in deposits:
             # Получаем шок ставки для валюты депозита
@@ -214,23 +251,20 @@ class DepositElasticityCalculator:
             # Определяем тип депозита
             deposit_type = self._determine_deposit_type(deposit)
 
-            # Получаем параметры эластичности
-            params_key = (segment, deposit_type)
-            if params_key not in self.elasticity_params:
-                # Пытаемся найти параметры для сегмента с любым типом депозита
-                params_key = (segment, DepositType.DEMAND)
-                if params_key not in self.elasticity_params:
-                    logger.warning(
-                        f"No elasticity parameters for {segment}/{deposit_type}, skipping",
-                        extra={
-                            'instrument_id': deposit.instrument_id,
-                            'segment': segment.value,
-                            'deposit_type': deposit_type.value
-                        }
-                    )
-                    continue
-
-            params = self.elasticity_params[params_key]
+            # Получаем параметры эластичности (с откатом на DEMAND сегмента)
+            params = params_table[
+                _SEGMENT_INDEX[segment] * _N_DEPOSIT_TYPES + _DEPOSIT_TYPE_INDEX[deposit_type]
+            ]
+            if params is None:
+                logger.warning(
+                    f"No elasticity parameters for {segment}/{deposit_type}, skipping",
+                    extra={
+                        'instrument_id': deposit.instrument_id,
+                        'segment': segment.value,
+                        'deposit_type': deposit_type.value
+                    }
+                )
+                continue
 
             # Рассчитываем изменение объема
             volume_change = self._calculate_single_deposit_change(
@@ -5,7 +5,7 @@ Dynamic Balance Sheet Interest Rate Risk Calculator
 Этот модуль объединяет расчет эластичности депозитов и процентного риска,
 создавая динамический баланс, где объемы депозитов меняются в ответ на изменение ставок.
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 from datetime import date
 
 import pandas as pd
@@ -45,7 +45,7 @@ class DynamicBalanceIRRCalculator:
         self,
         calculation_date: date,
         repricing_buckets: List[str],
-        elasticity_params: Optional[Dict[Tuple[CustomerSegment, DepositType], ElasticityParameters]] = None,
+        elasticity_params: Optional[Mapping[Tuple[CustomerSegment, DepositType], ElasticityParameters]] = None,
         target_currencies: Optional[List[str]] = None
     ):
         """
@@ -9,7 +9,6 @@ Example: Deposit Elasticity Model for Interest Rate Risk
 4. Анализ влияния эластичности по сегментам клиентов
 """
 from datetime import date
-from decimal import Decimal
 import pandas as pd
 
 from alm_calculator.models.instruments.deposit import Deposit
@@ -39,7 +38,7 @@ def create_sample_portfolio():
     for i in range(10):
         instruments.append(Deposit(
             instrument_id=f"DEP_RETAIL_DEMAND_{i}",
-            amount=Decimal("5000000") + Decimal(i * 1000000),
+            amount=5000000.0 + i * 1000000,
             currency="RUB",
             interest_rate=0.06,
             start_date=date(2024, 1, 1),
@@ -53,7 +52,7 @@ def create_sample_portfolio():
     for i in range(15):
         instruments.append(Deposit(
             instrument_id=f"DEP_RETAIL_SHORT_{i}",
-            amount=Decimal("2000000") + Decimal(i * 500000),
+            amount=2000000.0 + i * 500000,
             currency="RUB",
             interest_rate=0.10,
             start_date=date(2024, 11, 1),
@@ -67,7 +66,7 @@ def create_sample_portfolio():
     for i in range(10):
         instruments.append(Deposit(
             instrument_id=f"DEP_RETAIL_MEDIUM_{i}",
-            amount=Decimal("3000000") + Decimal(i * 700000),
+            amount=3000000.0 + i * 700000,
             currency="RUB",
             interest_rate=0.11,
             start_date=date(2024, 7, 1),
@@ -83,7 +82,7 @@ def create_sample_portfolio():
     for i in range(8):
         instruments.append(Deposit(
             instrument_id=f"DEP_CORP_SHORT_{i}",
-            amount=Decimal("10000000") + Decimal(i * 2000000),
+            amount=10000000.0 + i * 2000000,
             currency="RUB",
             interest_rate=0.09,
             start_date=date(2024, 11, 1),
@@ -97,7 +96,7 @@ def create_sample_portfolio():
     for i in range(5):
         instruments.append(Deposit(
             instrument_id=f"DEP_CORP_DEMAND_{i}",
-            amount=Decimal("8000000") + Decimal(i * 1500000),
+            amount=8000000.0 + i * 1500000,
             currency="RUB",
             interest_rate=0.07,
             start_date=date(2024, 1, 1),
@@ -113,7 +112,7 @@ def create_sample_portfolio():
     for i in range(20):
         instruments.append(Loan(
             instrument_id=f"LOAN_MORTGAGE_{i}",
-            amount=Decimal("4000000") + Decimal(i * 500000),
+            amount=4000000.0 + i * 500000,
             currency="RUB",
             interest_rate=0.12,
             start_date=date(2023, 1, 1),
@@ -126,7 +125,7 @@ def create_sample_portfolio():
     for i in range(15):
         instruments.append(Loan(
             instrument_id=f"LOAN_CONSUMER_{i}",
-            amount=Decimal("500000") + Decimal(i * 100000),
+            amount=500000.0 + i * 100000,
             currency="RUB",
             interest_rate=0.18,
             start_date=date(2024, 6, 1),
@@ -139,7 +138,7 @@ def create_sample_portfolio():
     for i in range(10):
         instruments.append(Loan(
             instrument_id=f"LOAN_CORPORATE_{i}",
-            amount=Decimal("15000000") + Decimal(i * 3000000),
+            amount=15000000.0 + i * 3000000,
             currency="RUB",
             interest_rate=0.13,
             start_date=date(2024, 1, 1),
@@ -350,9 +349,9 @@ def analyze_multiple_rate_shocks():
     for scenario_name, result in results.items():
         total_volume_change = sum(
             vc.volume_change for vc in result['dynamic']['volume_changes']
-        ) if result['dynamic']['volume_changes'] else Decimal(0)
+        ) if result['dynamic']['volume_changes'] else 0.0
 
-        nii_diff = result['comparison']['nii_impact_difference'].get('RUB', Decimal(0))
+        nii_diff = result['comparison']['nii_impact_difference'].get('RUB', 0.0)
 
         scenario_summary.append({
             'Сценарий': scenario_name,
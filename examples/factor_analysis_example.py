@@ -8,7 +8,6 @@
 4. Применение к двум метрикам: горизонт выживания и процентный риск
 """
 from datetime import date, timedelta
-from decimal import Decimal
 import pandas as pd
 import logging
 from pathlib import Path
@@ -123,9 +122,9 @@ def calculate_simple_survival_horizon(
     Returns:
         Горизонт выживания в днях
     """
-    total_assets = Decimal(0)
-    total_liabilities = Decimal(0)
-    daily_liability_outflow = Decimal(0)
+    total_assets = 0.0
+    total_liabilities = 0.0
+    daily_liability_outflow = 0.0
 
     for inst in instruments:
         amount = inst.amount
@@ -145,7 +144,7 @@ def calculate_simple_survival_horizon(
                     daily_liability_outflow += daily_outflow
             else:
                 # Бессрочный пассив - предполагаем 1% в день
-                daily_liability_outflow += abs(amount) * Decimal('0.01')
+                daily_liability_outflow += abs(amount) * 0.01
 
     # Горизонт выживания = активы / дневной отток
     if daily_liability_outflow > 0:
@@ -167,7 +166,7 @@ def calculate_simple_survival_horizon(
 def calculate_simple_interest_rate_risk(
     instruments: List[BaseInstrument],
     calc_date: date
-) -> Decimal:
+) -> float:
     """
     Упрощенный расчет процентного риска (для демонстрации).
 
@@ -181,8 +180,8 @@ def calculate_simple_interest_rate_risk(
     Returns:
         Процентный гэп
     """
-    rsa = Decimal(0)  # Rate-Sensitive Assets
-    rsl = Decimal(0)  # Rate-Sensitive Liabilities
+    rsa = 0.0  # Rate-Sensitive Assets
+    rsl = 0.0  # Rate-Sensitive Liabilities
 
     for inst in instruments:
         # Определяем, является ли инструмент rate-sensitive
@@ -8,7 +8,6 @@
 3. Расчет горизонта выживания с множественными сценариями (NAME, MARKET, COMBO)
 """
 from datetime import date
-from decimal import Decimal
 import pandas as pd
 import json
 from pathlib import Path
@@ -10,7 +10,6 @@
 import logging
 from pathlib import Path
 from datetime import date
-from decimal import Decimal
 
 from alm_calculator.data.loaders.csv_loader import load_mock_data
 from alm_calculator.risks.interest_rate.currency_interest_rate_gaps import CurrencyInterestRateGapCalculator
@@ -0,0 +1,61 @@
+"""
+Тесты для CSVDataLoader: одинаковый результат при разных путях чтения CSV
+"""
+import pytest
+
+from alm_calculator.data.loaders.csv_loader import CSVDataLoader
+
+
+# Строка без balance_account отбрасывается как неполная; is_demand_deposit
+# смешивает литералы True/False с прочим текстом
+DEPOSITS_CSV = """\
+instrument_id,instrument_type,balance_account,amount,currency,start_date,maturity_date,interest_rate,counterparty_id,counterparty_type,as_of_date,is_demand_deposit,core_portion,withdrawal_rates
+DEPO_001,deposit,42301,1000000.5,RUB,2024-12-25,2025-01-24,0.15,CPTY_001,corporate,2024-12-31,False,,
+DEPO_002,deposit,42601,250000.0,USD,2024-10-04,2025-04-02,0.03,CPTY_002,retail,2024-12-31,False,0.8,"{'0-30d': 0.1, '30-90d': 0.2}"
+DEPO_003,deposit,,50000.0,RUB,2024-11-01,,0.01,CPTY_003,retail,2024-12-31,True,,
+DEPO_004,deposit,42301,75000.25,RUB,2024-11-01,,0.01,,retail,2024-12-31,1,0.5,
+DEPO_005,deposit,42301,120000.0,EUR,2024-09-15,2025-09-15,0.02,CPTY_005,corporate,2024-12-31,no,,
+"""
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Фикстура с директорией, содержащей deposits.csv"""
+    (tmp_path / 'deposits.csv').write_text(DEPOSITS_CSV, encoding='utf-8')
+    return tmp_path
+
+
+def _dump(instruments):
+    return [instrument.model_dump() for instrument in instruments]
+
+
+class TestLoaderPaths:
+    """Путь чтения файла не должен влиять на значения инструментов"""
+
+    def test_small_file_matches_pandas(self, data_dir):
+        """Тест: csv.reader (небольшой файл) и pd.read_csv дают одинаковые инструменты"""
+        small = CSVDataLoader(data_dir).load_by_type('deposits')
+        pandas = CSVDataLoader(data_dir, csv_engine='c').load_by_type('deposits')
+
+        assert len(small) == 4
+        assert _dump(small) == _dump(pandas)
+        assert [d.balance_account for d in pandas] == ['42301', '42601', '42301', '42301']
+        assert [d.is_demand_deposit for d in pandas] == [False, False, True, True]
+
+    def test_small_file_matches_pyarrow(self, data_dir):
+        """Тест: разбор таблицы pyarrow.csv дает те же инструменты"""
+        pytest.importorskip('pyarrow')
+
+        small = CSVDataLoader(data_dir).load_by_type('deposits')
+        arrow = CSVDataLoader(data_dir, csv_engine='pyarrow').load_by_type('deposits')
+
+        assert _dump(small) == _dump(arrow)
+
+    def test_chunked_matches_whole_file(self, data_dir):
+        """Тест: потоковое чтение блоками дает те же инструменты, что и чтение целиком"""
+        whole = CSVDataLoader(data_dir, csv_engine='c').load_by_type('deposits')
+        # Блоки по 2 строки: в первом колонки без пропусков и только False,
+        # во втором - пустой balance_account и прочие литералы
+        chunked = CSVDataLoader(data_dir, csv_engine='c', chunksize=2).load_by_type('deposits')
+
+        assert _dump(chunked) == _dump(whole)
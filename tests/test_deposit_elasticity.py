@@ -17,8 +17,10 @@ from alm_calculator.risks.interest_rate.deposit_elasticity import (
 from alm_calculator.config.elasticity_config_example import (
     create_baseline_elasticity_config,
     create_conservative_elasticity_config,
-    create_optimistic_elasticity_config
+    create_optimistic_elasticity_config,
+    get_elasticity_config
 )
+from alm_calculator.core.exceptions import ConfigurationError
 
 
 @pytest.fixture
@@ -301,6 +303,47 @@ class TestDepositElasticityCalculator:
         # Проверяем, что изменение не больше 15%
         assert abs(vc.volume_change_pct) <= 0.15
 
+    def test_reassigned_elasticity_params_are_used(self, calculation_date):
+        """Тест: замена и изменение elasticity_params учитываются в следующем расчете"""
+        def retail_demand_config(base_elasticity):
+            return {
+                (CustomerSegment.RETAIL, DepositType.DEMAND): ElasticityParameters(
+                    customer_segment=CustomerSegment.RETAIL,
+                    deposit_type=DepositType.DEMAND,
+                    base_elasticity=base_elasticity,
+                    adjustment_speed=1.0
+                )
+            }
+
+        calculator = DepositElasticityCalculator(calculation_date, retail_demand_config(-0.5))
+
+        deposit = Deposit(
+            instrument_id="DEP_TEST",
+            balance_account="42301",
+            amount=1000000.0,
+            currency="RUB",
+            interest_rate=0.08,
+            start_date=date(2024, 1, 1),
+            as_of_date=calculation_date,
+            maturity_date=date(2025, 12, 31),
+            is_demand_deposit=True,
+            counterparty_type="retail"
+        )
+        rate_shocks = {'RUB': 100.0}
+
+        before = calculator.calculate_volume_changes([deposit], rate_shocks)[0]
+
+        calculator.elasticity_params = retail_demand_config(-1.5)
+        reassigned = calculator.calculate_volume_changes([deposit], rate_shocks)[0]
+
+        calculator.elasticity_params.update(retail_demand_config(-1.0))
+        updated = calculator.calculate_volume_changes([deposit], rate_shocks)[0]
+
+        assert before.elasticity_used == -0.5
+        assert reassigned.elasticity_used == -1.5
+        assert updated.elasticity_used == -1.0
+        assert reassigned.volume_change < updated.volume_change < before.volume_change
+
     def test_create_dynamic_balance_sheet(
         self,
         calculation_date,
@@ -354,6 +397,15 @@ class TestDepositElasticityCalculator:
 class TestElasticityConfigs:
     """Тесты для различных конфигураций эластичности"""
 
+    def test_default_parameters_shared_between_configs(self):
+        """Дефолтные параметры разделяются между конфигурациями"""
+        baseline = create_baseline_elasticity_config()
+        custom = get_elasticity_config('custom')
+
+        key = (CustomerSegment.CORPORATE, DepositType.LONG_TERM)
+        assert baseline[key] is custom[key]
+        assert baseline[key] is ElasticityParameters.create_corporate_default(DepositType.LONG_TERM)
+
     def test_baseline_config(self):
         """Тест базовой конфигурации"""
         config = create_baseline_elasticity_config()
@@ -388,6 +440,28 @@ class TestElasticityConfigs:
 
         assert opt_elasticity <= base_elasticity
 
+    def test_get_elasticity_config_unknown_name(self):
+        """Неизвестное имя конфигурации - ошибка конфигурации"""
+        with pytest.raises(ConfigurationError, match="Available"):
+            get_elasticity_config('nonexistent')
+
+    def test_get_elasticity_config_is_cached(self):
+        """Повторный запрос конфигурации переиспользует построенные параметры"""
+        first = get_elasticity_config('conservative')
+        second = get_elasticity_config('conservative')
+
+        assert first is second
+
+        # Разделяемая конфигурация доступна только для чтения
+        key = (CustomerSegment.RETAIL, DepositType.DEMAND)
+        with pytest.raises(TypeError):
+            first[key] = None
+
+        # Изменяемая копия не влияет на кэш
+        config = dict(first)
+        config.pop(key)
+        assert key in get_elasticity_config('conservative')
+
 
 class TestAsymmetricElasticity:
     """Тесты для асимметричной эластичности"""